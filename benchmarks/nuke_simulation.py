@@ -0,0 +1,301 @@
+# benchmarks/nuke_simulation.py
+#
+# Replays simulated nuke attacks through SecurityCog's listeners using fake guild,
+# audit log and member objects, and reports how fast each attacker gets banned.
+#
+# Usage (from the repository root):
+#     python -m benchmarks.nuke_simulation --attackers 50 --events-per-attacker 100 --rate 2000
+#     python -m benchmarks.nuke_simulation --scenario low-rate
+
+import argparse
+import asyncio
+import itertools
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import discord
+
+from cogs.security_cog import SecurityCog
+
+ACTIONS = {
+    "ban": discord.AuditLogAction.ban,
+    "kick": discord.AuditLogAction.kick,
+    "delete": discord.AuditLogAction.channel_delete,
+}
+
+_ids = itertools.count(10_000)
+
+# Preset arguments; anything given on the command line wins
+SCENARIOS = {
+    # A fast nuke: many actions per attacker, far more than the threshold
+    "nuke": {"attackers": 50, "events_per_attacker": 100, "rate": 2000, "audit_latency": 0.15},
+    # A slow, sustained attack where each attacker stops right at the threshold, so a
+    # single missed audit log lookup lets them through
+    "low-rate": {"attackers": 50, "events_per_attacker": None, "rate": 20, "audit_latency": 0.4},
+}
+
+
+# =================================================================================
+# FAKE DISCORD OBJECTS
+# =================================================================================
+class FakeUser:
+    def __init__(self, name: str):
+        self.id = next(_ids)
+        self.name = name
+        self.mention = f"<@{self.id}>"
+
+    def __str__(self):
+        return self.name
+
+
+class FakeChannel:
+    def __init__(self, guild, name: str):
+        self.id = next(_ids)
+        self.guild = guild
+        self.name = name
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content)
+
+
+class FakeMember(FakeUser):
+    def __init__(self, guild, name: str, user_id: int = None):
+        super().__init__(name)
+        self.guild = guild
+        if user_id is not None:
+            self.id = user_id
+            self.mention = f"<@{self.id}>"
+
+
+class FakeAuditEntry:
+    def __init__(self, user, target, action):
+        self.id = next(_ids)
+        self.user = user
+        self.target = target
+        self.action = action
+        self.created_at = datetime.now(timezone.utc)
+
+
+class FakeGuild:
+    """
+    Keeps an in-memory audit log and simulates the latency of audit log reads and bans.
+    A ban is logged and dispatched like any other, so the bot sees its own bans come back
+    as on_member_ban and on_member_remove events.
+    """
+
+    def __init__(self, bot, audit_latency: float, ban_latency: float, gateway_delay: float):
+        self.id = next(_ids)
+        self.bot = bot
+        self.audit_latency = audit_latency
+        self.ban_latency = ban_latency
+        self.gateway_delay = gateway_delay
+        self.entries = []  # Oldest first
+        self.audit_log_calls = 0
+        self.ban_times = {}  # attacker id -> perf_counter() when the ban landed
+        self.cog = None  # Receives the events the bot's own bans cause
+        self.event_tasks = []
+
+    def record(self, user, target, action):
+        self.entries.append(FakeAuditEntry(user, target, action))
+
+    async def audit_logs(self, limit=100, action=None):
+        # Like discord.py, read newest first in pages of 100 entries, one request per page
+        matching = [e for e in reversed(self.entries) if action is None or e.action == action][:limit]
+        for page_start in range(0, max(1, len(matching)), 100):
+            self.audit_log_calls += 1
+            await asyncio.sleep(self.audit_latency)
+            for entry in matching[page_start:page_start + 100]:
+                yield entry
+
+    async def ban(self, user, reason=None):
+        await asyncio.sleep(self.ban_latency)
+        self.ban_times.setdefault(user.id, time.perf_counter())
+        self.record(self.bot.user, user, discord.AuditLogAction.ban)
+        self.event_tasks.append(asyncio.create_task(self._dispatch_own_ban(user)))
+
+    async def _dispatch_own_ban(self, user):
+        await asyncio.sleep(self.gateway_delay)
+        await asyncio.gather(self.cog.on_member_ban(self, user),
+                             self.cog.on_member_remove(FakeMember(self, user.name, user.id)))
+
+
+class FakeBot:
+    def __init__(self):
+        self.user = FakeUser("anti-nuke bot")
+        self.alert_channel = FakeChannel(None, "general")
+
+    def get_channel(self, channel_id):
+        return self.alert_channel
+
+
+# =================================================================================
+# SIMULATION
+# =================================================================================
+def _tracker_size(tracker: dict) -> int:
+    """Approximate memory held by the action tracker: the dict, its keys, the deques and their timestamps."""
+    size = sys.getsizeof(tracker)
+    for key, window in tracker.items():
+        size += sys.getsizeof(key) + sys.getsizeof(window)
+        size += sum(sys.getsizeof(timestamp) for timestamp in window)
+    return size
+
+
+def _threshold_for(cog: SecurityCog, action_type: str) -> int:
+    return {"ban": cog.ban_threshold, "kick": cog.kick_threshold, "delete": cog.delete_threshold}[action_type]
+
+
+async def run_simulation(attackers: int, events_per_attacker: int, rate: float, action_mode: str,
+                         audit_latency: float, ban_latency: float, gateway_delay: float, seed: int) -> dict:
+    rng = random.Random(seed)
+    bot = FakeBot()
+    guild = FakeGuild(bot, audit_latency, ban_latency, gateway_delay)
+    cog = SecurityCog(bot)
+    guild.cog = cog
+
+    attacker_users = [FakeUser(f"attacker{i}") for i in range(attackers)]
+    events = []
+    for user in attacker_users:
+        if events_per_attacker is None:
+            # Exactly `threshold` actions of one kind: every lookup has to succeed for a ban
+            action_type = rng.choice(list(ACTIONS)) if action_mode == "mixed" else action_mode
+            events.extend([(user, action_type)] * _threshold_for(cog, action_type))
+            continue
+        for _ in range(events_per_attacker):
+            action_type = rng.choice(list(ACTIONS)) if action_mode == "mixed" else action_mode
+            events.append((user, action_type))
+    rng.shuffle(events)
+
+    # Count lookups the coalescer gave up on (returned None although the entry exists).
+    # Lookups for the events the bot's own bans cause are counted apart: their removal has
+    # no kick entry to find, so "unmatched" there is the right answer.
+    attacker_ids = {user.id for user in attacker_users}
+    lookups = {"matched": 0, "unmatched": 0, "own": 0}
+    find_entry = cog.audit_log_reader.find_entry
+
+    async def counting_find_entry(guild, action, target_id):
+        entry = await find_entry(guild, action, target_id)
+        if target_id in attacker_ids:
+            lookups["own"] += 1
+        else:
+            lookups["matched" if entry is not None else "unmatched"] += 1
+        return entry
+
+    cog.audit_log_reader.find_entry = counting_find_entry
+
+    tracker_size_before = _tracker_size(cog.action_tracker)
+    tracker_size_peak = tracker_size_before
+
+    counts = {}  # (attacker id, action type) -> actions so far
+    threshold_times = {}  # attacker id -> perf_counter() when they first crossed a threshold
+    listener_tasks = []
+
+    async def dispatch(user, action_type):
+        # The gateway event reaches the bot a little after the audit log entry is written
+        await asyncio.sleep(gateway_delay)
+        if action_type == "ban":
+            target = FakeUser("victim")
+            guild.record(user, target, ACTIONS["ban"])
+            await cog.on_member_ban(guild, target)
+        elif action_type == "kick":
+            target = FakeMember(guild, "victim")
+            guild.record(user, target, ACTIONS["kick"])
+            await cog.on_member_remove(target)
+        else:
+            target = FakeChannel(guild, "channel")
+            guild.record(user, target, ACTIONS["delete"])
+            await cog.on_guild_channel_delete(target)
+
+    # Events are released in 10ms ticks (longer at low rates) to approximate `rate` events per second
+    tick = max(0.01, 1 / rate)
+    per_tick = max(1, round(rate * tick))
+    start = time.perf_counter()
+    for i in range(0, len(events), per_tick):
+        for user, action_type in events[i:i + per_tick]:
+            key = (user.id, action_type)
+            counts[key] = counts.get(key, 0) + 1
+            if counts[key] == _threshold_for(cog, action_type):
+                threshold_times.setdefault(user.id, time.perf_counter())
+            listener_tasks.append(asyncio.create_task(dispatch(user, action_type)))
+        await asyncio.sleep(tick)
+        tracker_size_peak = max(tracker_size_peak, _tracker_size(cog.action_tracker))
+    await asyncio.gather(*listener_tasks)
+    while guild.event_tasks:
+        # Bans landing now can still dispatch more events
+        tasks, guild.event_tasks = guild.event_tasks, []
+        await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    tracker_size_after = _tracker_size(cog.action_tracker)
+    tracker_size_peak = max(tracker_size_peak, tracker_size_after)
+
+    reaction_times = [guild.ban_times[uid] - threshold_times[uid] for uid in threshold_times if uid in guild.ban_times]
+    return {
+        "events": len(events),
+        "elapsed": elapsed,
+        "attackers_expected": len(threshold_times),
+        "attackers_banned": len(reaction_times),
+        "reaction_times": sorted(reaction_times),
+        "audit_log_calls": guild.audit_log_calls,
+        "lookups_matched": lookups["matched"],
+        "lookups_unmatched": lookups["unmatched"],
+        "lookups_own": lookups["own"],
+        "tracker_keys": len(cog.action_tracker),
+        "tracker_timestamps": sum(len(window) for window in cog.action_tracker.values()),
+        "memory_growth": tracker_size_after - tracker_size_before,
+        "memory_peak": tracker_size_peak,
+    }
+
+
+def _percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def print_report(results: dict):
+    times_ms = [t * 1000 for t in results["reaction_times"]]
+    print(f"Replayed {results['events']} events in {results['elapsed']:.2f}s "
+          f"({results['events'] / results['elapsed']:.0f} events/s)")
+    print(f"Attackers banned: {results['attackers_banned']}/{results['attackers_expected']} | "
+          f"audit lookups matched: {results['lookups_matched']}/{results['events']} "
+          f"(unmatched: {results['lookups_unmatched']}, for the bot's own bans: {results['lookups_own']})")
+    if times_ms:
+        print(f"Time-to-ban after crossing threshold (ms): "
+              f"min {times_ms[0]:.1f} | median {statistics.median(times_ms):.1f} | "
+              f"p95 {_percentile(times_ms, 95):.1f} | max {times_ms[-1]:.1f}")
+    print(f"Audit log requests: {results['audit_log_calls']} "
+          f"({results['audit_log_calls'] / max(1, results['events']):.3f} per event)")
+    print(f"action_tracker: {results['tracker_keys']} keys, {results['tracker_timestamps']} timestamps")
+    print(f"action_tracker memory growth: {results['memory_growth'] / 1024:.1f} KiB "
+          f"(peak {results['memory_peak'] / 1024:.1f} KiB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay simulated nuke bursts through SecurityCog.")
+    parser.add_argument("--scenario", choices=list(SCENARIOS), default="nuke")
+    parser.add_argument("--attackers", type=int)
+    parser.add_argument("--events-per-attacker", type=int, help="Default: the scenario's (low-rate: the threshold).")
+    parser.add_argument("--rate", type=float, help="Events per second across all attackers.")
+    parser.add_argument("--action", choices=[*ACTIONS, "mixed"], default="mixed")
+    parser.add_argument("--audit-latency", type=float, help="Seconds per audit log request.")
+    parser.add_argument("--ban-latency", type=float, default=0.1, help="Seconds per ban request.")
+    parser.add_argument("--gateway-delay", type=float, default=0.05, help="Seconds between audit entry and event.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for name, value in SCENARIOS[args.scenario].items():
+        if getattr(args, name) is None:
+            setattr(args, name, value)
+
+    results = asyncio.run(run_simulation(
+        args.attackers, args.events_per_attacker, args.rate, args.action,
+        args.audit_latency, args.ban_latency, args.gateway_delay, args.seed
+    ))
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
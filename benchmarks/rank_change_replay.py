@@ -0,0 +1,84 @@
+# benchmarks/rank_change_replay.py
+#
+# Replays ranking snapshots through the rank change detector and reports how long
+# the diffs take. Snapshots come either from a file recorded by the bot
+# (config.RANK_SNAPSHOT_LOG_PATH) or are generated for a synthetic roster.
+#
+# Usage (from the repository root):
+#     python -m benchmarks.rank_change_replay --players 5000 --snapshots 2000 --changes 3
+#     python -m benchmarks.rank_change_replay --file rank_snapshots.jsonl
+
+import argparse
+import random
+import time
+from collections import Counter
+
+from data import ranks
+from utils.player_registry import Player
+from utils.rank_changes import RankChangeDetector, load_snapshots
+
+_DIVISION_BY_VALUE = {value: tier_division for tier_division, value in ranks.items() if value < ranks["MASTER I"]}
+
+
+def _make_ranking(player: Player, rank_value: int) -> tuple:
+    """Builds a ranking tuple the same way LeaderboardCog does from a rank value."""
+    division_value, lp = divmod(rank_value, 100)
+    if division_value >= ranks["MASTER I"]:
+        # Apex LP isn't capped at 100 and has no division
+        lp = rank_value - ranks["MASTER I"] * 100
+        return player, rank_value, lp, "MASTER", f"MASTER {lp} LP"
+    tier_division = _DIVISION_BY_VALUE[division_value]
+    return player, rank_value, lp, tier_division.split()[0], f"{tier_division} {lp} LP"
+
+
+def generate_snapshots(player_count: int, snapshot_count: int, changes_per_snapshot: int,
+                       seed: int) -> list[tuple[str, float, list]]:
+    """A sequence of states where a few random players win or lose LP between each one."""
+    rng = random.Random(seed)
+    players = [Player(i, f"player{i}", None, None, None) for i in range(player_count)]
+    bottom_value, top_value = ranks["IRON IV"] * 100, ranks["MASTER I"] * 100 + 800
+    values = {player.id: rng.randint(bottom_value, top_value) for player in players}
+
+    snapshots = []
+    for n in range(snapshot_count):
+        for player in rng.sample(players, min(changes_per_snapshot, player_count)):
+            values[player.id] = max(bottom_value, min(top_value, values[player.id] + rng.randint(-45, 45)))
+        rankings = sorted((_make_ranking(p, values[p.id]) for p in players), key=lambda x: x[1], reverse=True)
+        snapshots.append(("TFT", float(n), rankings))
+    return snapshots
+
+
+def print_report(snapshots: list, events: list, elapsed: float):
+    boards = len(snapshots)
+    rows = sum(len(rankings) for _, _, rankings in snapshots)
+    print(f"Replayed {boards} snapshots ({rows} ranking rows) in {elapsed * 1000:.1f}ms "
+          f"({elapsed / max(1, boards - 1) * 1e6:.1f}us per diff)")
+    print(f"Events: {len(events)}")
+    for kind, count in sorted(Counter(event.kind for event in events).items()):
+        print(f"  {kind:<14}{count}")
+    overtakes = sum(1 for event in events if event.overtaken is not None)
+    print(f"Overtakes (position_up with a previous holder): {overtakes}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay ranking snapshots through the rank change detector.")
+    parser.add_argument("--file", help="JSON lines file recorded by the bot; overrides the synthetic roster.")
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--snapshots", type=int, default=1000)
+    parser.add_argument("--changes", type=int, default=3, help="Players whose LP changes between snapshots.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.file:
+        snapshots = load_snapshots(args.file)
+    else:
+        snapshots = generate_snapshots(args.players, args.snapshots, args.changes, args.seed)
+
+    start = time.perf_counter()
+    events = RankChangeDetector.replay(snapshots)
+    elapsed = time.perf_counter() - start
+    print_report(snapshots, events, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# cogs/chart_cog.py
+
+import asyncio
+import io
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+import discord
+from discord.ext import commands, tasks
+
+from utils import ChartGenerator
+import config
+
+
+class ChartCog(commands.Cog):
+    """A cog to draw LP progression charts from the recorded rank history."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.chart_generator = ChartGenerator(config.FONT_PATH, config.ranks)
+        # (game, player ids, days) -> (history versions of its players when drawn, PNG bytes)
+        self.chart_cache = OrderedDict()
+        self.tree_synced = False
+
+    async def cog_load(self):
+        if config.WEEKLY_GRAPH_CHANNEL_ID:
+            self.weekly_graph_task.start()
+
+    def cog_unload(self):
+        """Gracefully stop all background tasks."""
+        self.weekly_graph_task.cancel()
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """Registers the /graph slash command once the bot is connected."""
+        if not self.tree_synced:
+            try:
+                await self.bot.tree.sync()
+                self.tree_synced = True
+            except discord.HTTPException as e:
+                logging.error(f"Failed to sync slash commands: {e}")
+
+    # --- Rendering ---
+    async def _render_chart(self, game_type: str, players: list, days: int) -> bytes | None:
+        """Renders (or reuses) the chart for these players and range. Cached until one of them has new points."""
+        key = (game_type, tuple(player.id for player in players), days)
+        version = tuple(config.rank_history.get_version(game_type, player.get_puuid(game_type)) for player in players)
+        cached = self.chart_cache.get(key)
+        if cached and cached[0] == version:
+            self.chart_cache.move_to_end(key)
+            return cached[1]
+
+        now = time.time()
+        since = now - days * 24 * 3600
+        series = [
+            (player.name, config.rank_history.get_points(game_type, player.get_puuid(game_type), since))
+            for player in players if player.get_puuid(game_type)
+        ]
+        # Drawing happens off the event loop so the bot stays responsive
+        image_buffer = await asyncio.to_thread(
+            self.chart_generator.generate_lp_chart, series, since, now, f"{game_type} LP - last {days} days"
+        )
+        if image_buffer is None:
+            return None
+
+        image_bytes = image_buffer.getvalue()
+        self.chart_cache[key] = (version, image_bytes)
+        if len(self.chart_cache) > config.GRAPH_CACHE_SIZE:
+            self.chart_cache.popitem(last=False)
+        return image_bytes
+
+    def _top_players(self, game_type: str, count: int) -> list:
+        """The current top players of a leaderboard, or the first roster entries if none are ranked yet."""
+        leaderboard_cog = self.bot.get_cog("LeaderboardCog")
+        if leaderboard_cog:
+            rankings = leaderboard_cog.leaderboards[game_type]["current_rankings"]
+            if rankings:
+                return [ranking[0] for ranking in rankings[:count]]
+        return config.player_registry.players_for(game_type)[:count]
+
+    # --- Commands ---
+    @commands.hybrid_command(name="graph", description="Draws LP progression for one or more players.")
+    async def graph(self, ctx: commands.Context, game: str = "TFT", days: int = 7, *, players: str = ""):
+        """Usage: /graph [TFT|LoL] [days] [player1, player2, ...] (defaults to the current top 10)."""
+        game_type = {"tft": "TFT", "lol": "LoL"}.get(game.lower())
+        if game_type is None:
+            await ctx.send("Game must be TFT or LoL.")
+            return
+        days = max(1, min(days, config.RANK_HISTORY_DAYS))
+
+        if players.strip():
+            names = [name.strip() for name in players.split(",") if name.strip()]
+            selected = [config.player_registry.get_by_name(name) for name in names]
+            unknown = [name for name, player in zip(names, selected) if player is None]
+            if unknown:
+                await ctx.send(f"Unknown player(s): {', '.join(unknown)}")
+                return
+        else:
+            selected = self._top_players(game_type, config.WEEKLY_GRAPH_PLAYER_COUNT)
+
+        # Rendering can take longer than the 3 seconds a slash command has to respond
+        await ctx.defer()
+        image_bytes = await self._render_chart(game_type, selected, days)
+        if image_bytes is None:
+            await ctx.send("Failed to draw the chart.")
+            return
+        await ctx.send(file=discord.File(io.BytesIO(image_bytes), filename=f"{game_type}_lp_{days}d.png"))
+
+    # --- Weekly Post ---
+    @tasks.loop(time=config.WEEKLY_GRAPH_TIME)
+    async def weekly_graph_task(self):
+        """
+        Posts last week's LP progression of the top players for both games.
+        Runs daily at a fixed time and only posts on the configured weekday, so
+        restarts and deploys don't post it again.
+        """
+        if datetime.now(config.WEEKLY_GRAPH_TIME.tzinfo).weekday() != config.WEEKLY_GRAPH_WEEKDAY:
+            return
+        channel = self.bot.get_channel(config.WEEKLY_GRAPH_CHANNEL_ID)
+        if not channel:
+            logging.error(f"Weekly graph channel {config.WEEKLY_GRAPH_CHANNEL_ID} not found.")
+            return
+        for game_type in ("TFT", "LoL"):
+            players = self._top_players(game_type, config.WEEKLY_GRAPH_PLAYER_COUNT)
+            image_bytes = await self._render_chart(game_type, players, 7)
+            if image_bytes is None:
+                continue
+            try:
+                await channel.send(
+                    content=f"**{game_type.upper()}**: LP progression of the week",
+                    file=discord.File(io.BytesIO(image_bytes), filename=f"{game_type}_weekly.png")
+                )
+            except discord.HTTPException as e:
+                logging.error(f"[{game_type}] Failed to send weekly graph: {e}")
+
+    @weekly_graph_task.before_loop
+    async def before_weekly_graph(self):
+        await self.bot.wait_until_ready()
+
+
+# This setup function is required for the bot to load the cog
+async def setup(bot: commands.Bot):
+    await bot.add_cog(ChartCog(bot))
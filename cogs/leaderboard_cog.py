@@ -5,10 +5,13 @@ import discord
 from discord.ext import commands, tasks
 import asyncio
 import logging
+import os
 import random
+from collections import Counter
 from datetime import datetime, timedelta
 
-from utils import ImageGenerator, RiotAPIClient
+from utils import (ImageGenerator, IdentityCache, RiotAPIClient, load_roster, summarize_match, RankChangeDetector,
+                   SnapshotRecorder)
 import config
 import itertools
 
@@ -20,34 +23,45 @@ class LeaderboardCog(commands.Cog):
         self.image_generator = ImageGenerator(font_path=config.FONT_PATH)
         self.tasks_started = False
         self.summoner_batch_cycler = None
-
-        tft_api_key = self.bot.tft_api_key
-        lol_api_key = self.bot.lol_api_key
+        self.roster_mtime = self._get_roster_mtime()
+        # Set when a Riot ID lookup failed (not "doesn't exist", but a failed request), so the
+        # roster watcher retries on its next tick instead of waiting for the file to be edited
+        self.identity_retry_pending = False
+        # Shared by every fetch (startup, rolling batches) to bound concurrent API calls
+        self.fetch_semaphore = asyncio.Semaphore(config.FETCH_CONCURRENCY)
+        # Fire-and-forget work (match ingestion); references kept so tasks aren't garbage collected
+        self.background_tasks = set()
+        self.ingesting = set()  # (game, player id) with a match ingestion in flight
+        # Match ingestion has its own, smaller limit so it can never starve the ranked fetches
+        self.ingest_semaphore = asyncio.Semaphore(config.MATCH_INGEST_CONCURRENCY)
+        recorder = SnapshotRecorder(config.RANK_SNAPSHOT_LOG_PATH) if config.RANK_SNAPSHOT_LOG_PATH else None
+        self.rank_change_detector = RankChangeDetector(sinks=[self._alert_on_rank_changes], recorder=recorder)
+
+        tft_api_keys = self.bot.tft_api_keys
+        lol_api_keys = self.bot.lol_api_keys
 
         self.leaderboards = {
             "TFT": {
-                "client": RiotAPIClient(tft_api_key, config.REGION),
+                "client": RiotAPIClient(tft_api_keys, config.REGION, config.ACCOUNT_REGION, config.RIOT_RATE_LIMITS),
                 "channel_id": config.TFT_LEADERBOARD_CHANNEL_ID,
                 "background_path": config.TFT_BACKGROUND_PATH,
                 "queue_type": config.TFT_QUEUE_TYPE,
-                "get_summoner_id_func": config.tft_summoner_ids.get,
                 "current_rankings": [],
-                "previous_rankings": [],
-                "image_message": None,
+                "image_messages": [],
+                "page_signatures": [],
                 "timer_message": None,
                 "next_update_time": None,
                 "last_displayed_text": "",
                 "lock": asyncio.Lock()
             },
             "LoL": {
-                "client": RiotAPIClient(lol_api_key, config.REGION),
+                "client": RiotAPIClient(lol_api_keys, config.REGION, config.ACCOUNT_REGION, config.RIOT_RATE_LIMITS),
                 "channel_id": config.LOL_LEADERBOARD_CHANNEL_ID,
                 "background_path": config.LOL_BACKGROUND_PATH,
                 "queue_type": config.LOL_QUEUE_TYPE,
-                "get_summoner_id_func": config.lol_summoner_ids.get,
                 "current_rankings": [],
-                "previous_rankings": [],
-                "image_message": None,
+                "image_messages": [],
+                "page_signatures": [],
                 "timer_message": None,
                 "next_update_time": None,
                 "last_displayed_text": "",
@@ -59,12 +73,15 @@ class LeaderboardCog(commands.Cog):
     async def on_ready(self):
         """Runs once the bot is ready. Performs initial setup."""
         if not self.tasks_started:
+            # --- RESOLVE RIOT IDS NOT YET IN THE IDENTITY CACHE ---
+            try:
+                entries = await self._resolve_identities(load_roster(config.ROSTER_PATH))
+                config.player_registry.sync(entries)
+            except (OSError, ValueError) as e:
+                logging.error(f"Could not load roster from {config.ROSTER_PATH}: {e}")
+
             # --- SETUP THE ROLLING BATCHES ---
-            all_summoners = config.summoner_names_list[:]
-            random.shuffle(all_summoners)
-            batches = [all_summoners[i:i + config.API_BATCH_SIZE] for i in
-                       range(0, len(all_summoners), config.API_BATCH_SIZE)]
-            self.summoner_batch_cycler = itertools.cycle(batches)
+            self._rebuild_batch_cycler()
 
             logging.info("Bot is ready. Cleaning up old leaderboard messages...")
             await asyncio.gather(
@@ -80,13 +97,24 @@ class LeaderboardCog(commands.Cog):
             self.fetcher_task.start()
             self.updater_task.start()
             self.countdown_task.start()
+            self.roster_watcher_task.start()
+            self.identity_revalidation_task.start()
             self.tasks_started = True
 
+    def _rebuild_batch_cycler(self):
+        """(Re)builds the rolling batch cycler from the current roster."""
+        all_summoners = config.player_registry.players[:]
+        random.shuffle(all_summoners)
+        batches = [all_summoners[i:i + config.API_BATCH_SIZE] for i in
+                   range(0, len(all_summoners), config.API_BATCH_SIZE)]
+        self.summoner_batch_cycler = itertools.cycle(batches) if batches else None
+
     # --- ONE-TIME FULL FETCH FOR STARTUP ---
     async def _initial_full_fetch(self):
         """Fetches data for ALL players once on startup."""
-        all_summoners = config.summoner_names_list[:]
-        # We can process all batches in parallel on startup for speed
+        all_summoners = config.player_registry.players[:]
+        # All batches are started together on startup; the shared fetch semaphore
+        # keeps the number of in-flight requests bounded.
         all_batches = [all_summoners[i:i + config.API_BATCH_SIZE] for i in
                        range(0, len(all_summoners), config.API_BATCH_SIZE)]
 
@@ -108,8 +136,10 @@ class LeaderboardCog(commands.Cog):
                 logging.error(f"[{game_type}] Cannot clean channel {lb['channel_id']}: Not found.")
                 return
 
-            # Fetch last 5 messages and delete any that are from our bot
-            async for message in channel.history(limit=5):
+            # A previous run posted one message per leaderboard page plus the timer. Look back far
+            # enough for all of them, with room for a bigger roster last run and other users' messages.
+            pages = math.ceil(len(config.player_registry.players_for(game_type)) / self.image_generator.page_size)
+            async for message in channel.history(limit=2 * (pages + 1) + 10):
                 if message.author.id == self.bot.user.id:
                     await message.delete()
                     logging.info(f"[{game_type}] Deleted old bot message {message.id}")
@@ -118,11 +148,195 @@ class LeaderboardCog(commands.Cog):
         except Exception as e:
             logging.error(f"[{game_type}] Error during channel cleanup: {e}")
 
-    def cog_unload(self):
-        """Gracefully stop all background tasks."""
+    async def cog_unload(self):
+        """Gracefully stop all background tasks and close the API connection pools."""
         self.fetcher_task.cancel()
         self.updater_task.cancel()
         self.countdown_task.cancel()
+        self.roster_watcher_task.cancel()
+        self.identity_revalidation_task.cancel()
+        for task in self.background_tasks:
+            task.cancel()
+        for lb in self.leaderboards.values():
+            await lb["client"].close()
+
+    # --- Roster Hot-Reload Loop ---
+    def _get_roster_mtime(self) -> float | None:
+        try:
+            return os.path.getmtime(config.ROSTER_PATH)
+        except OSError:
+            return None
+
+    @tasks.loop(seconds=config.ROSTER_RELOAD_INTERVAL_SECONDS)
+    async def roster_watcher_task(self):
+        """
+        Watches the roster file and applies changes without restarting the bot.
+        Also reapplies the roster while some Riot IDs couldn't be resolved because of a failed request.
+        """
+        mtime = self._get_roster_mtime()
+        if mtime is None:
+            return
+        file_changed = mtime != self.roster_mtime
+        if not file_changed and not self.identity_retry_pending:
+            return
+        self.roster_mtime = mtime
+
+        try:
+            entries = load_roster(config.ROSTER_PATH)
+        except (OSError, ValueError) as e:
+            # json.JSONDecodeError is a ValueError; keep the current roster until the file is fixed
+            logging.error(f"Could not reload roster from {config.ROSTER_PATH}: {e}")
+            return
+
+        entries = await self._resolve_identities(entries)
+        added, removed = config.player_registry.sync(entries)
+        if not added and not removed:
+            if file_changed:
+                logging.info("Roster file changed, but no players were added or removed.")
+            return
+        logging.info(f"Roster reloaded: +{[p.name for p in added]} -{[p.name for p in removed]}")
+
+        # Drop removed players from the rankings. Players moving up into their spot
+        # haven't overtaken anyone, so this never triggers a rank-change alert.
+        removed_ids = {player.id for player in removed}
+        for lb in self.leaderboards.values():
+            async with lb["lock"]:
+                lb["current_rankings"] = [r for r in lb["current_rankings"] if r[0].id not in removed_ids]
+
+        self._rebuild_batch_cycler()
+
+        # New players are fetched right away instead of waiting for their turn in the cycle
+        if added:
+            await asyncio.gather(
+                self._fetch_and_update_batch("TFT", added),
+                self._fetch_and_update_batch("LoL", added)
+            )
+
+    @roster_watcher_task.before_loop
+    async def before_roster_watcher(self):
+        await self.bot.wait_until_ready()
+
+    # --- Riot ID Resolution ---
+    def _key_counts(self) -> dict[str, int]:
+        return {game_type: lb["client"].key_count for game_type, lb in self.leaderboards.items()}
+
+    def _check_api_keys(self, entries: list) -> list:
+        """Drops roster "api_key" values that don't name a configured key for both games."""
+        key_count = min(self._key_counts().values())
+        checked = []
+        for entry in entries:
+            api_key = entry.get("api_key")
+            if api_key is not None and (not isinstance(api_key, int) or not 0 <= api_key < key_count):
+                logging.warning(f"Roster: invalid api_key {api_key!r} for '{entry['name']}', "
+                                f"expected 0 to {key_count - 1}. Assigning a key automatically.")
+                entry = {k: v for k, v in entry.items() if k != "api_key"}
+            checked.append(entry)
+        return checked
+
+    async def _resolve_identities(self, entries: list) -> list:
+        """
+        Fills in the PUUIDs of roster entries that only have a "riot_id".
+        Cached identities are used as-is; only unknown Riot IDs cost an API call.
+        A new Riot ID is resolved with the roster's "api_key", or else with the key
+        fewest players of that game are pinned to, which keeps the load spread evenly.
+        """
+        entries = config.identity_cache.fill_entries(self._check_api_keys(entries), self._key_counts())
+        failed_requests = []
+        key_loads = {
+            game_type: Counter(entry[key_field] for entry in entries if entry.get(field))
+            for game_type, field, key_field in IdentityCache.FIELDS
+        }
+
+        def pick_key(entry, game_type):
+            if entry.get("api_key") is not None:
+                return entry["api_key"]
+            loads = key_loads[game_type]
+            key_index = min(range(self.leaderboards[game_type]["client"].key_count), key=lambda i: loads[i])
+            loads[key_index] += 1  # Count it right away so concurrent lookups spread too
+            return key_index
+
+        async def resolve(entry, game_type, field, key_field):
+            game_name, tag_line = entry["riot_id"].rsplit("#", 1)
+            key_index = pick_key(entry, game_type)
+            async with self.fetch_semaphore:
+                account = await self.leaderboards[game_type]["client"].get_account_by_riot_id(
+                    game_name, tag_line, key_index
+                )
+            if account is None:
+                failed_requests.append(entry["riot_id"])  # Retried by the roster watcher
+                return False
+            if not account.get("puuid"):
+                logging.warning(f"[{game_type}] Riot ID {entry['riot_id']} for '{entry['name']}' does not exist.")
+                return False
+            entry[field], entry[key_field] = account["puuid"], key_index
+            config.identity_cache.set_puuid(game_type, entry["riot_id"], account["puuid"], key_index)
+            logging.info(f"[{game_type}] Resolved {entry['riot_id']} for '{entry['name']}'.")
+            return True
+
+        lookups = []
+        for entry in entries:
+            riot_id = entry.get("riot_id")
+            if not riot_id:
+                continue
+            if "#" not in riot_id:
+                logging.warning(f"Roster: invalid Riot ID {riot_id!r} for '{entry['name']}', expected gameName#tagLine.")
+                continue
+            for game_type, field, key_field in IdentityCache.FIELDS:
+                if not entry.get(field):
+                    lookups.append(resolve(entry, game_type, field, key_field))
+
+        if lookups and any(await asyncio.gather(*lookups)):
+            config.identity_cache.save()
+        if failed_requests:
+            logging.warning(f"Could not resolve {len(failed_requests)} Riot ID lookup(s), will retry shortly.")
+        self.identity_retry_pending = bool(failed_requests)
+        return entries
+
+    @tasks.loop(hours=config.IDENTITY_REVALIDATE_INTERVAL_HOURS)
+    async def identity_revalidation_task(self):
+        """
+        Re-checks the oldest cached identities against the API to pick up name changes.
+        Only one batch per game is checked per run to keep the extra API load small.
+        """
+        max_age = config.IDENTITY_MAX_AGE_DAYS * 24 * 3600
+        changed = False
+        try:
+            removed = config.identity_cache.prune(load_roster(config.ROSTER_PATH))
+        except (OSError, ValueError) as e:
+            logging.error(f"Could not load roster from {config.ROSTER_PATH}: {e}")
+            removed = 0
+        if removed:
+            logging.info(f"Dropped {removed} cached identities no longer in the roster.")
+            changed = True
+
+        for game_type, lb in self.leaderboards.items():
+            for entry in config.identity_cache.get_stale(game_type, max_age)[:config.API_BATCH_SIZE]:
+                key_index = entry.get("key", 0)
+                if key_index >= lb["client"].key_count:
+                    continue  # That key was removed; the player gets resolved again with another one
+                account = await lb["client"].get_account_by_puuid(entry["puuid"], key_index)
+                if account is None:
+                    continue  # Request failed; try again next run
+                if not account:
+                    # The account is gone; keep the entry but move it to the back of the queue,
+                    # so it can't keep other players from being revalidated
+                    logging.warning(f"[{game_type}] Account of {entry['riot_id']} no longer exists.")
+                    config.identity_cache.mark_checked(game_type, entry["riot_id"])
+                    changed = True
+                    continue
+                current_riot_id = f"{account.get('gameName')}#{account.get('tagLine')}"
+                if current_riot_id.casefold() != entry["riot_id"].casefold():
+                    logging.info(f"[{game_type}] {entry['riot_id']} is now known as {current_riot_id}.")
+                    # Both the old and new Riot ID keep pointing to the same PUUID
+                    config.identity_cache.set_puuid(game_type, current_riot_id, entry["puuid"], key_index)
+                config.identity_cache.set_puuid(game_type, entry["riot_id"], entry["puuid"], key_index)
+                changed = True
+        if changed:
+            config.identity_cache.save()
+
+    @identity_revalidation_task.before_loop
+    async def before_identity_revalidation(self):
+        await self.bot.wait_until_ready()
 
     # --- Data Fetching Loop ---
     @tasks.loop(seconds=config.RANK_FETCH_INTERVAL_SECONDS)
@@ -133,7 +347,7 @@ class LeaderboardCog(commands.Cog):
 
         # Get the next batch from our infinite cycler
         batch_to_fetch = next(self.summoner_batch_cycler)
-        logging.info(f"Fetching rolling update for batch: {batch_to_fetch}")
+        logging.info(f"Fetching rolling update for batch: {[player.name for player in batch_to_fetch]}")
 
         # Process this single batch for both games
         await asyncio.gather(
@@ -141,58 +355,144 @@ class LeaderboardCog(commands.Cog):
             self._fetch_and_update_batch("LoL", batch_to_fetch)
         )
 
-    async def _fetch_and_update_batch(self, game_type: str, summoner_batch: list):
-        """Helper to fetch and process a batch of summoners for a specific game type."""
+    async def _process_summoner(self, game_type: str, player) -> tuple | None:
+        """Fetches and parses the ranked entry of a single player for a specific game type."""
         lb = self.leaderboards[game_type]
+        puuid = player.get_puuid(game_type)
+        stats = await lb["client"].get_ranked_stats_by_puuid(
+            puuid, game_type, player.platform, player.get_key(game_type)
+        )
+        if stats is None:
+            return None
+        ranked_stats = next((s for s in stats if s.get("queueType") == lb["queue_type"]), None)
+        if ranked_stats:
+            tier = ranked_stats.get("tier", "UNRANKED")
+            rank = ranked_stats.get("rank", "")
+            lp = ranked_stats.get("leaguePoints", 0)
+            tier_division = f"{tier} {rank}"
+            rank_value = config.ranks.get(tier_division, 0) * 100 + lp
+            tier_division_lp = f"{tier} {rank} {lp} LP"
+            if tier in ["MASTER", "GRANDMASTER", "CHALLENGER"]:
+                tier_division_lp = f"{tier} {lp} LP"
+            return player, rank_value, lp, tier, tier_division_lp
+        else:
+            return player, 0, 0, "UNRANKED", "UNRANKED"
 
-        async def process_summoner(name):
-            # ... (this inner function does not need to be changed) ...
-            puuid = lb["get_summoner_id_func"](name)
-            if not puuid:
-                return None
-            stats = await lb["client"].get_ranked_stats_by_puuid(puuid, game_type)
-            if stats is None:
-                return None
-            ranked_stats = next((s for s in stats if s.get("queueType") == lb["queue_type"]), None)
-            if ranked_stats:
-                tier = ranked_stats.get("tier", "UNRANKED")
-                rank = ranked_stats.get("rank", "")
-                lp = ranked_stats.get("leaguePoints", 0)
-                tier_division = f"{tier} {rank}"
-                rank_value = config.ranks.get(tier_division, 0) * 100 + lp
-                tier_division_lp = f"{tier} {rank} {lp} LP"
-                if tier in ["MASTER", "GRANDMASTER", "CHALLENGER"]:
-                    tier_division_lp = f"{tier} {lp} LP"
-                return name, rank_value, lp, tier, tier_division_lp
-            else:
-                return name, 0, 0, "UNRANKED", "UNRANKED"
-
-        # Fetch all summoners in the batch concurrently
-        results = await asyncio.gather(*(process_summoner(name) for name in summoner_batch))
-
-        # Filter out any failed lookups
-        batch_rankings = [r for r in results if r is not None]
-
-        # Log the result for each summoner in the processed batch
-        for ranking_data in batch_rankings:
-            name, _, _, _, tier_division_lp = ranking_data
-            logging.info(f"[{game_type}] Fetched: {name:<16} -> {tier_division_lp}")
-        # The ":<16" part adds padding to the name for clean alignment in the logs.
-
-        # Update the shared list under a lock
+    async def _fetch_and_update_batch(self, game_type: str, summoner_batch: list):
+        """
+        Fetches a batch of summoners for a specific game type as a streaming pipeline.
+        - Requests run under the shared concurrency limit, each with its own timeout.
+        - Results are applied to the rankings as soon as they arrive, so a slow or
+          rate-limited player never holds back the rest of the batch.
+        """
+        results_queue = asyncio.Queue()
+
+        async def produce(player):
+            result = None
+            try:
+                async with self.fetch_semaphore:
+                    result = await asyncio.wait_for(
+                        self._process_summoner(game_type, player),
+                        timeout=config.PLAYER_FETCH_TIMEOUT_SECONDS
+                    )
+            except asyncio.TimeoutError:
+                logging.warning(f"[{game_type}] Fetch for {player.name} timed out after "
+                                f"{config.PLAYER_FETCH_TIMEOUT_SECONDS} seconds. Skipping this cycle.")
+            except Exception as e:
+                logging.error(f"[{game_type}] Unexpected error while fetching {player.name}: {e}")
+            finally:
+                # Always report back, even on failure, so the consumer knows when the batch is done
+                await results_queue.put(result)
+
+        # Players without a PUUID for this game never take up a fetch slot
+        players = [player for player in summoner_batch if player.get_puuid(game_type)]
+        producers = [asyncio.create_task(produce(player)) for player in players]
+
+        applied = 0
+        try:
+            for _ in range(len(producers)):
+                ranking = await results_queue.get()
+                if ranking is None:
+                    continue  # Failed lookup
+                # The ":<16" part adds padding to the name for clean alignment in the logs.
+                logging.info(f"[{game_type}] Fetched: {ranking[0].name:<16} -> {ranking[4]}")
+                if await self._apply_ranking(game_type, ranking):
+                    self._schedule_match_ingestion(game_type, ranking[0])
+                applied += 1
+        finally:
+            # If we are cancelled (e.g. cog unload), don't leave orphaned requests behind
+            for task in producers:
+                task.cancel()
+
+        logging.info(f"[{game_type}] Batch applied ({applied}/{len(players)}). "
+                     f"Total players now: {len(self.leaderboards[game_type]['current_rankings'])}")
+
+    async def _apply_ranking(self, game_type: str, ranking: tuple) -> bool:
+        """
+        Inserts or replaces a single player's ranking in the shared list under the lock.
+        Returns True if the player's rank or LP changed since their last known ranking.
+        """
+        lb = self.leaderboards[game_type]
+        player = ranking[0]
+        if config.player_registry.get_by_name(player.name) is not player:
+            return False  # Removed from the roster while the request was in flight
         async with lb["lock"]:
-            rankings_map = {ranking[0]: ranking for ranking in lb["current_rankings"]}
-
-            for ranking in batch_rankings:
-                summoner_name = ranking[0]
-                rankings_map[summoner_name] = ranking
-
-            updated_list = list(rankings_map.values())
+            player_id = player.id
+            updated_list = lb["current_rankings"][:]
+            index = next((i for i, r in enumerate(updated_list) if r[0].id == player_id), None)
+            previous = updated_list[index] if index is not None else None
+            # Replace the row in place: the sort is stable, so players tied on rank value
+            # keep their order instead of swapping every time one of them is re-fetched
+            if index is not None:
+                updated_list[index] = ranking
+            else:
+                updated_list.append(ranking)
             updated_list.sort(key=lambda x: x[1], reverse=True)
-
             lb["current_rankings"] = updated_list
 
-            logging.info(f"[{game_type}] Batch applied. Total players now: {len(lb['current_rankings'])}")
+        # Every applied result is diffed against the previous state, so swaps between
+        # display updates are no longer missed
+        await self.rank_change_detector.process(game_type, updated_list)
+
+        # Keep the LP history for charts (unranked isn't a point on the LP scale)
+        if ranking[3] != "UNRANKED":
+            config.rank_history.record(game_type, player.get_puuid(game_type), ranking[1])
+
+        return previous is not None and (previous[1], previous[4]) != (ranking[1], ranking[4])
+
+    # --- Match History Ingestion ---
+    def _schedule_match_ingestion(self, game_type: str, player):
+        """Fetches a player's new matches in the background, without delaying the leaderboard."""
+        key = (game_type, player.id)
+        if key in self.ingesting:
+            return  # Already running; it will pick up every match since the cursor anyway
+        self.ingesting.add(key)
+        task = asyncio.create_task(self._ingest_matches(game_type, player))
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+        task.add_done_callback(lambda _: self.ingesting.discard(key))
+
+    async def _ingest_matches(self, game_type: str, player):
+        """Stores summaries of the matches played since the player's last seen match."""
+        puuid = player.get_puuid(game_type)
+        client = self.leaderboards[game_type]["client"]
+        try:
+            async with self.ingest_semaphore:
+                result = await client.fetch_new_matches(
+                    puuid, game_type, config.match_history.get_cursor(game_type, puuid),
+                    initial_count=config.MATCH_HISTORY_INITIAL_COUNT, platform=player.platform,
+                    max_concurrency=config.MATCH_INGEST_CONCURRENCY, key_index=player.get_key(game_type)
+                )
+        except Exception as e:
+            logging.error(f"[{game_type}] Match ingestion failed for {player.name}: {e}")
+            return
+        if result is None:
+            return
+
+        matches, cursor = result
+        summaries = [s for s in (summarize_match(game_type, m, puuid) for m in matches) if s]
+        config.match_history.add_matches(game_type, puuid, summaries, cursor)
+        logging.info(f"[{game_type}] Ingested {len(summaries)} new match(es) for {player.name}.")
 
     # --- Leaderboard Image Updater Loop ---
     @tasks.loop(seconds=config.LEADERBOARD_UPDATE_INTERVAL_SECONDS)
@@ -202,6 +502,11 @@ class LeaderboardCog(commands.Cog):
             self._update_leaderboard_display("TFT"),
             self._update_leaderboard_display("LoL")
         )
+        for game_type, lb in self.leaderboards.items():
+            lb["client"].single_flight.log_stats(game_type)
+            logging.info(f"[{game_type}] Requests per host: {lb['client'].get_budget_stats()}")
+        config.rank_history.save()
+        config.match_history.save()
 
     @updater_task.before_loop
     async def before_updater(self):
@@ -232,25 +537,26 @@ class LeaderboardCog(commands.Cog):
 
     async def _update_leaderboard_display(self, game_type: str):
         """
-        Fetches data, generates an image, and updates the leaderboard display.
+        Fetches data, generates the leaderboard pages, and updates the leaderboard display.
         - Creates a persistent timer message on the first run.
-        - On subsequent runs, edits the timer and replaces the old image.
+        - The full roster is split into pages; only pages whose content changed are
+          re-rendered (in parallel) and re-uploaded, by editing their message in place.
         """
         lb = self.leaderboards[game_type]
 
         async with lb["lock"]:
             current_rankings = lb["current_rankings"][:]
-            if not current_rankings:
-                logging.warning(f"[{game_type}] No rankings available to generate image.")
-                return
-            await self._check_and_notify_rank_changes(game_type, current_rankings)
-            lb["previous_rankings"] = current_rankings[:]
-
-        image_buffer = self.image_generator.generate_leaderboard_image(current_rankings, lb["background_path"])
-        if image_buffer is None:
-            logging.error(f"[{game_type}] Failed to generate leaderboard image.")
+        if not current_rankings:
+            logging.warning(f"[{game_type}] No rankings available to generate image.")
             return
 
+        pages = self.image_generator.paginate(current_rankings)
+        total_pages = len(pages)
+        # What a page shows; if this is unchanged, so is the image
+        signatures = [
+            (total_pages, tuple((r[0].id, r[0].name, r[3], r[4]) for r in page)) for page in pages
+        ]
+
         try:
             channel = self.bot.get_channel(lb["channel_id"])
             if not channel:
@@ -266,47 +572,89 @@ class LeaderboardCog(commands.Cog):
                 lb["last_displayed_text"] = placeholder_text
                 logging.info(f"[{game_type}] Created persistent timer message: {new_timer_message.id}")
 
-            # 2. Delete the old leaderboard image, if it exists.
-            if lb["image_message"]:
-                try:
-                    await lb["image_message"].delete()
-                except discord.NotFound:
-                    # This is fine, it means the message was already gone.
-                    logging.warning(f"[{game_type}] Old image message was already deleted, which is okay.")
-                except discord.HTTPException as e:
-                    logging.error(f"[{game_type}] Could not delete old image message: {e}")
-
-            # 3. Send the new leaderboard image.
-            new_image_message = await channel.send(
-                file=discord.File(image_buffer, filename=f"{game_type}_leaderboard.png")
-            )
-            lb["image_message"] = new_image_message  # Store the reference to the new message
-
-            # 4. Set the time for the next update.
+            # 2. Render only the pages that changed, in parallel worker threads.
+            changed = [
+                i for i in range(total_pages)
+                if i >= len(lb["image_messages"]) or i >= len(lb["page_signatures"])
+                or lb["page_signatures"][i] != signatures[i]
+            ]
+            buffers = await asyncio.gather(*(
+                asyncio.to_thread(self.image_generator.generate_leaderboard_image,
+                                  pages[i], lb["background_path"], i + 1, total_pages)
+                for i in changed
+            ))
+
+            # 3. Upload the changed pages: edit existing page messages in place so their
+            # order never changes, and send new messages for pages that didn't exist yet.
+            new_signatures = lb["page_signatures"][:total_pages]
+            new_signatures += [None] * (total_pages - len(new_signatures))
+            for i, image_buffer in zip(changed, buffers):
+                if image_buffer is None:
+                    logging.error(f"[{game_type}] Failed to generate leaderboard page {i + 1}.")
+                    continue
+                file = discord.File(image_buffer, filename=f"{game_type}_leaderboard_{i + 1}.png")
+                if i < len(lb["image_messages"]):
+                    try:
+                        lb["image_messages"][i] = await lb["image_messages"][i].edit(attachments=[file])
+                    except discord.NotFound:
+                        # Someone deleted the page; drop it and everything after so they get re-sent in order
+                        logging.warning(f"[{game_type}] Page {i + 1} message was deleted, re-sending pages.")
+                        await self._delete_messages(game_type, lb["image_messages"][i + 1:])
+                        lb["image_messages"] = lb["image_messages"][:i]
+                        lb["page_signatures"] = []
+                        return
+                else:
+                    lb["image_messages"].append(await channel.send(file=file))
+                new_signatures[i] = signatures[i]
+
+            # 4. Delete page messages left over from a larger roster.
+            await self._delete_messages(game_type, lb["image_messages"][total_pages:])
+            lb["image_messages"] = lb["image_messages"][:total_pages]
+            lb["page_signatures"] = new_signatures
+
+            # 5. Set the time for the next update.
             update_interval = config.LEADERBOARD_UPDATE_INTERVAL_SECONDS
             lb["next_update_time"] = datetime.now() + timedelta(seconds=update_interval)
 
-            # 5. Immediately edit the persistent timer message to reset the countdown.
+            # 6. Immediately edit the persistent timer message to reset the countdown.
             # The countdown_task will then take over for second-by-second updates.
             initial_timer_text = self._format_countdown_text(update_interval)
             await lb["timer_message"].edit(content=initial_timer_text)
             lb["last_displayed_text"] = initial_timer_text
 
-            logging.info(f"[{game_type}] Successfully updated leaderboard display.")
+            logging.info(f"[{game_type}] Successfully updated leaderboard display "
+                         f"({len(changed)}/{total_pages} pages re-rendered).")
 
         except discord.NotFound:
             # This is a critical failure if the persistent timer message is gone.
             # Resetting the state will cause it to be recreated on the next cycle.
             logging.warning(f"[{game_type}] Timer message was not found during update (likely deleted manually). Resetting state.")
-            lb["timer_message"], lb["image_message"] = None, None
+            self._reset_display_state(lb)
         except discord.HTTPException as e:
             logging.error(f"[{game_type}] A Discord API error occurred during display update: {e}")
             # If the error is 404 (Not Found), it means our timer message is gone. Reset to self-heal.
             if e.status == 404:
-                lb["timer_message"], lb["image_message"] = None, None
+                self._reset_display_state(lb)
         except Exception as e:
             logging.error(f"[{game_type}] An unexpected error occurred during display update: {e}", exc_info=True)
 
+    async def _delete_messages(self, game_type: str, messages: list):
+        """Deletes leaderboard page messages, ignoring ones that are already gone."""
+        for message in messages:
+            try:
+                await message.delete()
+            except discord.NotFound:
+                # This is fine, it means the message was already gone.
+                pass
+            except discord.HTTPException as e:
+                logging.error(f"[{game_type}] Could not delete old page message: {e}")
+
+    def _reset_display_state(self, lb: dict):
+        """Forgets all display messages so they get recreated on the next update."""
+        lb["timer_message"] = None
+        lb["image_messages"] = []
+        lb["page_signatures"] = []
+
     # --- Helper function to format countdown text ---
     def _format_countdown_text(self, seconds: int) -> str | None:
         """
@@ -331,35 +679,21 @@ class LeaderboardCog(commands.Cog):
             display_seconds = math.ceil(seconds / 10) * 10
             return f"Next update in: {display_seconds} seconds"
 
-    async def _check_and_notify_rank_changes(self, game_type: str, new_rankings: list):
-        """Compares old and new rankings and sends a message if there's a change."""
-        lb = self.leaderboards[game_type]
-        previous_rankings = lb["previous_rankings"]
-
-        # Only compare if we have a previous state to compare to
-        if not previous_rankings:
-            # The calling function will set the initial state. Nothing to do here.
-            return
-
-        # Compare the top players (e.g., top 4 or 5)
-        comparison_range = min(4, len(new_rankings),
-                               len(previous_rankings))  # Changed to 4 as per your original request
-        for i in range(comparison_range):
-            new_player = new_rankings[i][0]
-            old_player = previous_rankings[i][0]
-
-            if new_player != old_player:
-                old_player_indices = [idx for idx, p in enumerate(previous_rankings) if p[0] == new_player]
-                if old_player_indices and old_player_indices[0] > i:
-                    logging.info(
-                        f"[{game_type}] Rank change detected! {new_player} overtook {old_player} for rank {i + 1}.")
-                    await self._send_rank_change_alert(game_type, new_player, old_player, i + 1)
-
-    def _get_random_alert_message(self, game_type: str, new_summoner_name: str, old_summoner_name: str,
-                                  position: int) -> str:
+    async def _alert_on_rank_changes(self, events: list):
+        """Rank change sink: sends a fun alert whenever someone takes a top spot from another player."""
+        for event in events:
+            if event.kind != "position_up" or event.overtaken is None:
+                continue
+            if event.position > config.RANK_ALERT_TOP_POSITIONS:
+                continue
+            logging.info(f"[{event.game_type}] Rank change detected! {event.player.name} overtook "
+                         f"{event.overtaken.name} for rank {event.position}.")
+            await self._send_rank_change_alert(event.game_type, event.player, event.overtaken, event.position)
+
+    def _get_random_alert_message(self, game_type: str, new_player, old_player, position: int) -> str:
         """Generates a randomized, fun message for a rank change."""
-        new_summoner = config.discord_ids.get(new_summoner_name, new_summoner_name)
-        old_summoner = config.discord_ids.get(old_summoner_name, old_summoner_name)
+        new_summoner = new_player.display_mention
+        old_summoner = old_player.display_mention
 
         messages = [
             f"{new_summoner} just pulled off a spectacular heist {config.emoji_codes.get('business', '')}, ousting {old_summoner} from position {position} like a sneaky mastermind {config.emoji_codes.get('cathiago', '')}!",
@@ -409,7 +743,7 @@ class LeaderboardCog(commands.Cog):
         ]
         return f"**{game_type.upper()}**: " + random.choice(messages)
 
-    async def _send_rank_change_alert(self, game_type: str, new_summoner: str, old_summoner: str, position: int):
+    async def _send_rank_change_alert(self, game_type: str, new_summoner, old_summoner, position: int):
         """Sends a randomized, fun message to the general channel about a rank change."""
         channel = self.bot.get_channel(config.GENERAL_CHANNEL_ID)
         if not channel:
@@ -1,12 +1,111 @@
 # cogs/security_cog.py
 
+import asyncio
 import discord
 from discord.ext import commands
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
 import logging
 import config
 
+
+# =================================================================================
+# COALESCED AUDIT LOG READER
+# =================================================================================
+class AuditLogCoalescer:
+    """
+    Batches audit log lookups during a burst of events.
+    Instead of one `guild.audit_logs(limit=1)` call per ban/kick/delete (which falls
+    behind during a nuke and can miss entries), events are queued per (guild, action)
+    and resolved together by a single, larger audit log fetch.
+    """
+
+    def __init__(self, delay: float = 0.25, max_attempts: int = 2, max_entry_age: timedelta = timedelta(minutes=1),
+                 entry_lead: timedelta = timedelta(seconds=10)):
+        self.delay = delay  # How long to wait for more events before fetching
+        self.max_attempts = max_attempts  # Audit entries can lag behind the gateway event
+        self.max_entry_age = max_entry_age  # Older entries belong to some earlier action on the same target
+        # How much earlier than its gateway event an entry can be stamped (event delay and clock skew)
+        self.entry_lead = entry_lead
+        self.pending = defaultdict(dict)  # (guild_id, action) -> {target_id: [futures]}
+        self.received_at = {}  # future -> when its event arrived, to know how far back to read
+        self.flush_tasks = {}  # (guild_id, action) -> scheduled flush task
+        self.fetch_count = 0
+
+    async def find_entry(self, guild, action, target_id: int):
+        """Returns the audit log entry for `action` on `target_id`, or None if it can't be found."""
+        key = (guild.id, action)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[key].setdefault(target_id, []).append(future)
+        self.received_at[future] = datetime.now(timezone.utc)
+        if key not in self.flush_tasks:
+            self.flush_tasks[key] = asyncio.create_task(self._flush(guild, action, key))
+        try:
+            return await future
+        finally:
+            self.received_at.pop(future, None)
+
+    async def _flush(self, guild, action, key):
+        """
+        Reads the audit log until every pending event is matched or has been through
+        `max_attempts` reads. Events that arrive while a read is running are not counted
+        against that read; they get another one instead of being given up on.
+        Each read pages back (100 entries per request) until it passes the oldest pending
+        event, however many entries a burst has produced since.
+        """
+        attempts = {}  # future -> number of audit log reads it has been through
+        try:
+            while self.pending[key]:
+                await asyncio.sleep(self.delay)
+                waiting = self.pending[key]
+                if not waiting:
+                    return
+                # Only the events present when the read starts can expect their entry in it
+                in_read = [future for futures in waiting.values() for future in futures]
+                # Audit logs are returned newest first; stop once past the oldest pending event
+                now = datetime.now(timezone.utc)
+                oldest_event = min(self.received_at.get(future, now) for future in in_read)
+                read_until = max(oldest_event - self.entry_lead, now - self.max_entry_age)
+                self.fetch_count += 1
+                try:
+                    async for entry in guild.audit_logs(limit=None, action=action):
+                        if entry.created_at < read_until:
+                            break
+                        target = getattr(entry, "target", None)
+                        futures = waiting.pop(getattr(target, "id", None), None)
+                        for future in futures or ():
+                            if not future.done():
+                                future.set_result(entry)
+                        if not waiting:
+                            break
+                except discord.Forbidden:
+                    logging.error(f"Missing permissions to read audit logs in guild {guild.id}.")
+                    return
+                except discord.HTTPException as e:
+                    logging.error(f"Failed to read audit logs in guild {guild.id}: {e}")
+
+                # Give up on the events that have now been through enough reads without a match
+                for future in in_read:
+                    if future.done():
+                        continue
+                    attempts[future] = attempts.get(future, 0) + 1
+                    if attempts[future] >= self.max_attempts:
+                        future.set_result(None)
+                for target_id in list(waiting):
+                    remaining = [future for future in waiting[target_id] if not future.done()]
+                    if remaining:
+                        waiting[target_id] = remaining
+                    else:
+                        del waiting[target_id]
+        finally:
+            # Only reached with events left on errors (or cancellation): don't leave callers hanging
+            for futures in self.pending.pop(key, {}).values():
+                for future in futures:
+                    if not future.done():
+                        future.set_result(None)
+            self.flush_tasks.pop(key, None)
+
+
 # =================================================================================
 # ANTI-NUKE SECURITY COG
 # =================================================================================
@@ -19,65 +118,93 @@ class SecurityCog(commands.Cog):
         self.kick_threshold = 2
         self.delete_threshold = 2
         self.time_frame = timedelta(minutes=5)
-        self.action_tracker = defaultdict(list)
+        # (guild_id, user_id, action_type) -> timestamps of that user's recent actions, oldest first
+        self.action_tracker = defaultdict(deque)
+        self.audit_log_reader = AuditLogCoalescer()
+        # (guild_id, user_id) -> when we banned them, so a burst doesn't re-ban them hundreds of times.
+        # Only holds for one time frame (or until they are unbanned), so they can be caught again later.
+        self.punished = {}
+        self._checks_since_prune = 0
 
-    async def _check_actions(self, user, action_type, threshold):
+    async def _check_actions(self, guild_id, user, action_type, threshold):
         """
         Checks if a user has exceeded an action threshold in a given time frame.
+        Each (guild, user, action) has its own sliding window, so this is amortized O(1).
         """
         now = datetime.now(timezone.utc)
-        # Filter out old actions
-        self.action_tracker[action_type] = [
-            action for action in self.action_tracker[action_type] if now - action[1] < self.time_frame
-        ]
-        # Add the new action
-        self.action_tracker[action_type].append((user, now))
-        # Count actions by the specific user
-        user_actions = [action for action in self.action_tracker[action_type] if action[0] == user]
-        return len(user_actions) >= threshold
+        window = self.action_tracker[(guild_id, user.id, action_type)]
+        window.append(now)
+        # Drop actions that fell out of the time frame
+        while now - window[0] >= self.time_frame:
+            window.popleft()
+
+        self._checks_since_prune += 1
+        if self._checks_since_prune >= 1000:
+            self._prune_tracker(now)
+
+        return len(window) >= threshold
+
+    def _prune_tracker(self, now):
+        """Forgets users whose most recent action has left the window, so the tracker can't grow forever."""
+        self._checks_since_prune = 0
+        for key in [k for k, window in self.action_tracker.items() if not window or now - window[-1] >= self.time_frame]:
+            del self.action_tracker[key]
+        for key in [k for k, banned_at in self.punished.items() if now - banned_at >= self.time_frame]:
+            del self.punished[key]
+
+    async def _handle_action(self, guild, target, audit_action, action_type, threshold, description):
+        """Finds who performed an action via the audit log and bans them if they exceeded the threshold."""
+        entry = await self.audit_log_reader.find_entry(guild, audit_action, target.id)
+        if entry is None or entry.user is None:
+            return
+        if entry.user.id == self.bot.user.id:
+            return  # Our own anti-nuke bans (and anything else the bot does) never count
+        logging.info(f"{entry.user} {description}")
+        if not await self._check_actions(guild.id, entry.user, action_type, threshold):
+            return
+        now = datetime.now(timezone.utc)
+        banned_at = self.punished.get((guild.id, entry.user.id))
+        if banned_at is not None and now - banned_at < self.time_frame:
+            return  # Ban already in flight or just done
+        self.punished[(guild.id, entry.user.id)] = now
+
+        logging.warning(f"{entry.user} exceeded {action_type} threshold.")
+        try:
+            await guild.ban(entry.user, reason=f"Exceeded {action_type} threshold")
+        except discord.HTTPException as e:
+            logging.error(f"Failed to ban {entry.user}: {e}")
+            self.punished.pop((guild.id, entry.user.id), None)  # Let the next event try again
+            return
+        # Use self.bot to get the channel
+        channel = self.bot.get_channel(config.GENERAL_CHANNEL_ID)
+        if channel:
+            await channel.send(
+                f"{entry.user.mention} was banned for suspicious activity! RIP BOZO! <:PogO:949833186689568768>")
 
     # Use @commands.Cog.listener() decorator for events inside a cog
     @commands.Cog.listener()
     async def on_member_ban(self, guild, user):
-        async for entry in guild.audit_logs(limit=1, action=discord.AuditLogAction.ban):
-            if entry.target.id == user.id:
-                logging.info(f"{entry.user} banned {user.name}")
-                if await self._check_actions(entry.user, "ban", self.ban_threshold):
-                    logging.warning(f"{entry.user} exceeded ban threshold.")
-                    await guild.ban(entry.user, reason="Exceeded ban threshold")
-                    # Use self.bot to get the channel
-                    channel = self.bot.get_channel(config.GENERAL_CHANNEL_ID)
-                    if channel:
-                        await channel.send(
-                            f"{entry.user.mention} was banned for suspicious activity! RIP BOZO! <:PogO:949833186689568768>")
+        await self._handle_action(guild, user, discord.AuditLogAction.ban, "ban", self.ban_threshold,
+                                  f"banned {user.name}")
+
+    @commands.Cog.listener()
+    async def on_member_unban(self, guild, user):
+        # An admin lifted the ban (e.g. a false positive): watch this user from scratch again
+        self.punished.pop((guild.id, user.id), None)
+        for action_type in ("ban", "kick", "delete"):
+            self.action_tracker.pop((guild.id, user.id, action_type), None)
 
     @commands.Cog.listener()
     async def on_member_remove(self, member):
         # This specifically checks for kicks
-        async for entry in member.guild.audit_logs(limit=1, action=discord.AuditLogAction.kick):
-            if entry.target.id == member.id:
-                logging.info(f"{entry.user} kicked {member.name}")
-                if await self._check_actions(entry.user, "kick", self.kick_threshold):
-                    logging.warning(f"{entry.user} exceeded kick threshold.")
-                    await member.guild.ban(entry.user, reason="Exceeded kick threshold")
-                    channel = self.bot.get_channel(config.GENERAL_CHANNEL_ID)
-                    if channel:
-                        await channel.send(
-                            f"{entry.user.mention} was banned for suspicious activity! RIP BOZO! <:PogO:949833186689568768>")
+        await self._handle_action(member.guild, member, discord.AuditLogAction.kick, "kick", self.kick_threshold,
+                                  f"kicked {member.name}")
 
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, channel):
-        async for entry in channel.guild.audit_logs(limit=1, action=discord.AuditLogAction.channel_delete):
-            if entry.target.id == channel.id:
-                logging.info(f"{entry.user} deleted channel {channel.name}")
-                if await self._check_actions(entry.user, "delete", self.delete_threshold):
-                    logging.warning(f"{entry.user} exceeded delete threshold.")
-                    await channel.guild.ban(entry.user, reason="Exceeded delete threshold")
-                    alert_channel = self.bot.get_channel(config.GENERAL_CHANNEL_ID)
-                    if alert_channel:
-                        await alert_channel.send(
-                            f"{entry.user.mention} was banned for suspicious activity! RIP BOZO! <:PogO:949833186689568768>")
+        await self._handle_action(channel.guild, channel, discord.AuditLogAction.channel_delete, "delete",
+                                  self.delete_threshold, f"deleted channel {channel.name}")
 
 # This setup function is required for the bot to load the cog
 async def setup(bot: commands.Bot):
-    await bot.add_cog(SecurityCog(bot))
\ No newline at end of file
+    await bot.add_cog(SecurityCog(bot))
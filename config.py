@@ -1,15 +1,26 @@
 # config.py
 
+import datetime
+
 # --- Discord Channel IDs ---
 GENERAL_CHANNEL_ID = 1249887657761443841
 TFT_LEADERBOARD_CHANNEL_ID = 1249993766300024842
 LOL_LEADERBOARD_CHANNEL_ID = 1249993747119472693
 
 # --- API & Task Timings ---
-REGION = 'na1'
+REGION = 'na1'  # Default platform; roster entries can set their own "region" (e.g. "euw1", "kr")
+ACCOUNT_REGION = 'americas'
+# Per routing host (sliding windows of (requests, seconds)). These are development key limits.
+RIOT_RATE_LIMITS = [(20, 1), (100, 120)]
 RANK_FETCH_INTERVAL_SECONDS = 30
 LEADERBOARD_UPDATE_INTERVAL_SECONDS = 180
 API_BATCH_SIZE = 10
+FETCH_CONCURRENCY = 5
+PLAYER_FETCH_TIMEOUT_SECONDS = 20
+
+# --- Rank Change Alerts ---
+RANK_ALERT_TOP_POSITIONS = 4  # Overtakes for these top spots are announced in the general channel
+RANK_SNAPSHOT_LOG_PATH = None  # Set to a file path to record every ranking state for offline replay
 
 # --- Image Generation Constants ---
 FONT_PATH = "assets/fonts/BebasNeue-Regular.ttf"
@@ -20,5 +31,58 @@ LOL_BACKGROUND_PATH = "assets/img/leaderboard_soloq.png"
 TFT_QUEUE_TYPE = "RANKED_TFT"
 LOL_QUEUE_TYPE = "RANKED_SOLO_5x5"
 
+# --- Message Triggers ---
+# "match" is "exact" (case-insensitive, whole message) or "pattern" (regex searched in the message).
+# "channels" optionally restricts a trigger to a list of channel IDs.
+MESSAGE_TRIGGERS = [
+    {"trigger": "poggiesxdd", "content": "<:POGGIES:926135482360950824>"},
+    {"trigger": "pogo", "file": "assets/img/UNRANKED.png"},
+    {"trigger": "tpogo", "file": "assets/img/tpogo.png"},
+    {"trigger": "huhpogo", "file": "assets/img/huhpogo.gif"},
+    {"trigger": "caughtpogo", "file": "assets/img/caughtpogo.png"},
+    {"trigger": "bigcaughtpogo", "file": "assets/img/bigcaughtpogo.png"},
+    {"trigger": "pogoflickleave", "file": "assets/img/pogo_flick_leave.gif"},
+    {"trigger": "is gourish a noob ?", "file": "assets/img/tpogo.png", "delete_message": False,
+     "followup": "YES! {mention} IS A NOOB! AGREED!", "followup_user_id": 700837976544116808},
+]
+
+# --- Roster ---
+ROSTER_PATH = "roster.json"
+ROSTER_RELOAD_INTERVAL_SECONDS = 15
+IDENTITY_CACHE_PATH = "identity_cache.json"
+IDENTITY_REVALIDATE_INTERVAL_HOURS = 6
+IDENTITY_MAX_AGE_DAYS = 7
+
+# --- LP Charts ---
+RANK_HISTORY_PATH = "rank_history.json"
+RANK_HISTORY_DAYS = 90
+GRAPH_CACHE_SIZE = 32
+WEEKLY_GRAPH_CHANNEL_ID = None  # Set to a channel ID to enable the weekly LP chart post
+WEEKLY_GRAPH_PLAYER_COUNT = 10
+WEEKLY_GRAPH_WEEKDAY = 0  # Day of the weekly post (0 = Monday)
+WEEKLY_GRAPH_TIME = datetime.time(hour=17, tzinfo=datetime.timezone.utc)  # Time of the weekly post
+
+# --- Match History ---
+MATCH_HISTORY_PATH = "match_history.json"
+MATCH_HISTORY_MAX_PER_PLAYER = 100
+MATCH_HISTORY_INITIAL_COUNT = 5  # Matches fetched for a player we have no cursor for yet
+MATCH_INGEST_CONCURRENCY = 2  # Players ingested at once, and match requests in flight per player
+
 # --- Load data dictionaries ---
-from data import discord_ids, tft_summoner_ids, lol_summoner_ids, ranks, summoner_names_list, emoji_codes
\ No newline at end of file
+from data import ranks, emoji_codes
+
+# --- Player registry, loaded from the roster file and kept in sync while running ---
+# Riot IDs already resolved on a previous run are filled in from the identity cache,
+# so startup never spends API calls on them.
+from utils.identity_cache import IdentityCache
+from utils.player_registry import PlayerRegistry, load_roster
+identity_cache = IdentityCache(IDENTITY_CACHE_PATH)
+player_registry = PlayerRegistry.from_entries(identity_cache.fill_entries(load_roster(ROSTER_PATH)))
+
+# --- Rank history shared by the leaderboard (writer) and the charts (reader) ---
+from utils.rank_history import RankHistory
+rank_history = RankHistory(RANK_HISTORY_PATH, RANK_HISTORY_DAYS)
+
+# --- Match summaries, ingested only for players whose LP changed ---
+from utils.match_history import MatchHistoryStore
+match_history = MatchHistoryStore(MATCH_HISTORY_PATH, MATCH_HISTORY_MAX_PER_PLAYER)
\ No newline at end of file
@@ -1,109 +1,4 @@
-discord_ids = {"Simon": "<@149681004880199681>", "Settupss": "<@144611125391130624>",
-                   "Classiq": "<@155758849582825472>", "Wallaby": "<@315272936053276672>",
-                   "Sehnbon": "<@198960489022095360>", "Ramza": "<@86595633288351744>",
-                   "Gourish": "<@700837976544116808>", "Gabyumi": "<@241712679150944257>",
-                   "Best Pigeon NA": "<@180136748091834368>", "meyst": "<@153778413646118912>",
-                   "Limi": "<@715430081975025687>", "Z3Sleeper": "<@130242869708587008>",
-                   "BlackDrag": "<@244390872983011328>", "Flames": "<@80373001006096384>",
-                   "Tiny Cena": "<@154752158854545408>",
-                   "Aàrón": "<@64494156914888704>", "5billon": "<@133779784105721856>",
-                   "Nappy": "<@170962579974389762>", "KingNeptun3": "<@275435768661540866>", "cpt stryder": "<@148338461433135104>",
-                   "Yazeed": "<@495380694525280276>", "Kenpachi": "<@263107658762944512>",
-                   "cancerkween": "<@999785244045615224>",
-                   "azote": "<@80372982337241088>", "Kovannate3": "<@1946154    71226617865>",
-                   "MeowMix": "<@160067484559474688>", "Skrt Skrt Skaarl": "<@272440042251616256>",
-                   "Smoking hookah": "<@520754531525459969>", "Angel": "<@402638715849146378>",
-                   "Mews": "<@133458482232819712>", "Oogli": "<@173232033772994560>",
-                   "Rogier": "<@115992535855267844>",
-                   "Lewis Kane": "<@913637634767716393", "nasir": "<@1052819643351433268>", "Zotto": "<@148963530262052864>",
-                   "Evelynn Toes": "<@152469092182261761>", "Shrektangle": "<@117811507693223944>",
-                   "Wazzaii": "<@399391319300112386>", "Chopin": "<@112316340844462080>",
-                   "Andrei": "<@125330438515458048>", "Drzoan": "<@164114739050446849>"} # "Billie": "<@279031910984974346>"
-
-# TFT SUMMONER PUUID : /riot/account/v1/accounts/by-riot-id/{gameName}/{tagLine} : Pogo Bot TFT API Key
-tft_summoner_ids = {"Simon": "HcViC80nr7e1qdO-PTy64kgsOXOVuTTQEDp6YXkpG_1Prv32w243RfBHHCeq0aKF6CyACXQo4Lilfg",
-                    "Settupss": "sBW-VWp9U5IigHAle6LewqKR1g8sRqJfnRD-bW-UNoE_zcjKFPnHihZNHMbTzJ4t1Xi8tWV2lxL-LQ",
-                    "Classiq": "JLL97fOhG64Bxa_n9VgEw6lihfAjbmsZSsCmrc7yXRezt2k6C6wXQot0kaBeG5dhkvCvxj0Pjujg0Q",
-                    "Wallaby": "5Yy-wFhXPUQujKtmXn7tjqNz-18w31wonAgwFL0EV1jhRbWOkH-L-qsjDyUZEdaN4LEa_Fx_IvI6Eg",
-                    "Sehnbon": "74eavaLH6lrlt4vi93j3z8GYWlAizecgxzAhzVmu-wgdkeUq4uz1jgQzM2t1EfE-rl9IhmDICksIuQ",
-                    "Ramza": "p7pWsfaX1FBfHJj-rvqRIG-Rvipn2qnCCTsXUblISWt7panhGBWVNxEl_plM5DG0GyNZoOh12SL1zA",
-                    "Gourish": "AOba69s4K34HRfPcRe2b3aBxG5M3EI1YNk0hc85qtE-B08613kYDrkUE9inPjrxi5sKdd8i2jus0HQ",
-                    "Gabyumi": "q2Aq0nkOaz3L2ARnEGmDuEcS8X8fd9nk1u0LtArV44LvYgcs5YKBlDWUctp9Q3tOFdVIygNyWRN_Dw",
-                    "meyst": "ZwnHiC7l7jBbRmwE9WCFIOG-jtGL63U-U38thYXjx51CribkX6aPa6TR6rkuSTKz0HgAYFyQff1bXQ",
-                    "Limi": "5tg5EVfgxor0vLfdn4dhhWII-wyk8HtDPpyRIPYY0qQSB2c4xpE4du67xPlhLrOQaoXiziFkidnzbA",
-                    "Z3Sleeper": "8DNBDsUOcSWgzc5crmw_uCtDoiE7_57gkRujPauBDy5JLkduyMxBamcq-YcspxU8pcXp8O-eeRWYqQ",
-                    "BlackDrag": "jlGG5Miu5FeCfluCCvQYV5lEzkprRBqPQW-UkitBrDK4JdIcrBFNvkPDqC6ctHM6SLM3kVeoRloOpg",
-                    "Flames": "jF165wXRzGVd6SE-dNbh75uGGPD76N_b3H_PM_KyFmpK3cIilUZovmWd_QSX4suP1B5Cem6rXUz24g",
-                    "Tiny Cena": "qmzBC6R4lPmmdrPw7oAXgVU-dkJQ3MW1AAEL6dgrlfgeLLB8yUmfeCRBwMmqV9F8sbjIjjLYPqKLig",
-                    "Aàrón": "_Sy-gj3LzyQcbP5SYdsaYLMP8AM9cd3qoflGhJaKexFAOliyTxwERpPUPZgQG2oYKYKE3WoZl8J3hg",
-                    "5billon": "VtcQxMhuiODdFfjpQDSgMpiPGDIRIQyFT-kTtgFp6_bhg7j9_XzyISjozDd3rzgPl3m2pud5byFmHw",
-                    "Nappy": "gxMAODcx0KKAeZy91AZOq3JmbHbfT2t4btm0ObIFd8S5LnePlRgisR33m5CadRXHcWysGczyGtVEEQ",
-                    "KingNeptun3": "FtcfG6OqmlAkYE5M3Hsxw7mm6R3vESw7TPk3qLVuppDe2BT6uYLnkFMyi1MVrlf593a2xjp_unn1GQ",
-                    "cpt stryder": "8Ymq5CT9Ns7AmbMuA1gHgRYTcziPe7AtMWSj1K-ri27fwE-Sg4klxFR63S_SCDq5QdlsFh_vPEZoyg",
-                    "Azote": "5qlx-rurGGji-vJ_5eQ6L55xTJqARM5vlv0yBJAn_raH5QSQaRwJZoaS9lI1zjt4sL_Dhq-Ouc5CLw",
-                    "MeowMix": "pRVs-rJxhN8nnrCw5lBB8ewrfllucI9Xekk-3YD_UUpsQ30nbrLtfSfNHGws0-whYU6_At_W5kDUrg",
-                    "Skrt Skrt Skaarl": "ogSfUUE-dyAnQfEOk9FXiID6sZqgj8vBvKz_F5VMfpfYUVrr-FiWW79mEVal5flMZetSDXR9wsUDSQ",
-                    "Maa san": "q2pNR-5LqVGW9tSKYKtviXdfLHY6Nfr4bgm0ON_p0Rz_r7iBVJVbCikhx14mJdxbprmPFSfwKZ-2CQ",
-                    "Smoking hookah": "HJvcFzI7j3DKejs-3QslzlxnThn1jDRBRG3mC0ijYxwQSPUHoJihAVF-CaKaHWKEK7SpU0DF-F5SSA",
-                    "Angel": "mxhrzDdRntALrNNQTum_669GZ3gMBPzHkpktfaSa8QmSr3WlgbiJe9qOYZRA1EuES-xHUkOj_ah0jA",
-                    "Mews": "5ZEwWwtjLgdiVQ0MxdoDuDmYEAZ-jOZFXmMXMnDR2y3b6R4XYDO46sqIJg5fUxyR2I8hMNjzkr4nBA",
-                    "Oogli": "bgq79tRWc2wwgOYGWjExyhiPk7ANEpY2GDl6rDWvOLCdDAO10WAG7XRQyvHXjXpsKSdeMhHRDdePuA",
-                    "Rogier": "AZY1-IU2uBXlOGBxW7v7vrVEmr3i1TCHdDGokIagokPiaDXOibVOppU-n4_5lB5ishyNlTPHHBuEWQ",
-                    "Zotto": "th2PG32pg7-Oz2l45XoWKfo0AZm7yDtV5Vj9vq_mo0nMDONjBLYKMZBdu613WCSDyabcrnLx02fmig",
-                    "Evelynn Toes": "2uLRUiKz_nBWdQ_kuFZ9KoS85t3SlSV0l-dXgIvQcjH7reKlWHuGdaaEzSKUD7rBD4JqBGgWNik7YQ",
-                    "Shrektangle": "4LnSzvAO45U583W_fBxFBMk9QvJ6iiOR8TmLdRTDQ6oQYSRwqZ1YYoIBfu5hWI5UbDqp1x26zmd4yA",
-                    "Wazzaii": "F0jzQWbKreYnnWtNhXjRx0hzp2jnE-qS4hNwViut1_MZ5U-n5do4EPWrrC1LNni-HooVcVSaUpX3Og",
-                    "Chopin": "YgNXpmYB3DJuUYsz8cvQSTkwCPhHvgfyuP_ArI0YlkS75pIoUVVa8gCICc4OM7wzuzn4KYcWN1wLoA",
-                    "Andrei": "z7A_xz0As5e7vpP3D9q-h3ijl44ZFGzVYEmq1EXuTxnkfFT2wVahA3oIQV4CX6UjcrXU4zZz2v3NCQ",
-                    "Drzoan": "miE27_bEwA8N2mgRjCWbvKOrQOziNWpxRD6DjXPZ4lE2NCTkZMLobP7znVC-64OOWrYIjSGxzCQqCw",
-                    "Billie": "VNhq55ER2CRQeMxg3p7AxImONmDma1j72FG-erC1OWa0vIKeRh-CQ5aG_5mF4HDajyW6dq-2sXlagw",
-                    }
-
-# LoL SUMMONER PUUID : /riot/account/v1/accounts/by-riot-id/{gameName}/{tagLine} : Pogo Bot LoL API Key
-lol_summoner_ids = {"Simon": "Epjjk5nQJob27TdE4tfd6ogGhnjjKQGORsI6Y0mjhFc79k9vu7fyW5VrUn3IBM3JLhja9RRvYULASQ",
-                    "Settupss": "8uV34jdyBRzKD73RvXLjnSWeeh_iVtf8QCn8o57P9EMcb6Kw5WV6iQeyRzMawEbd7soqWVn6bld9cA",
-                    "Classiq": "wsBvflplguVtyqfMrVhT13p0ZzQEs1H--0U4jiGmIUVwblJ9E9Br_Sb9J38dR_tDqiknWuA4rm7gwA",
-                    "Wallaby": "REMUBzsdhG-pJZCGjvw2t6qEVM0P0DBKzxkjyN-ZH_Stwr_BpOGk5Z_UjY2PM3_ZxqkK9BK_R-xJUA",
-                    "Sehnbon": "_2igVQbU0vyXHvlMmprgj_cmihzf_hOKBoH9q30LkqDmYK6_lul-zNJSR7flPPkfJvQsOKZD2QrrTA",
-                    "Ramza": "9dtS-j0C7VbjlrE1oY_aHhweryUtoQLW2CXnMAJhtUQ0qKy2nSXYksx6PyQnRCCNYWPAexn_Ow1azw",
-                    "Gourish": "EmXJq_PCw4AeKrnzXsYxPdJriE3Gr47v0hYOo6xd0dpjiIc0EhRu7f-3gDqh7xyCXgHXlpGbfsTmTg",
-                    "Gabyumi": "KhqAibzKOzgEaVB4CacPG3lkRMmJb6YqSDVvRUz-wGOiFHF_4hCVYJvVmb2J_n8Nbn2a6VCee2qGvA",
-                    "meyst": "iRW7EQqwc0YxZIAakelpZEA25PtgqfsxW4MrZk_YyBcc5V8UEmNTCSDNs3tFNEeoC1zo3LxqWpZNLA",
-                    "Limi": "x0Ex3srhZ66TaL2YbSyEgNb7LLLbSc95Zt7OjVEIhSPJPMhzjstXDuDSBi7HM0X7Q209h4hPXCkHnA",
-                    "Z3Sleeper": "o-piP7ibIDv68Q1EHCV5wZCMKe-yLeiZie8Hio_tGKEz2-zFd63ashQD9tW_mL34bGal1QD39IdVsg",
-                    "BlackDrag": "A0Uz_AZHHyalM9hywJDqheT4cQ08lQBiIQcEBYjnAPeS17aA-v42YiE77aU9ui80OdOa-oZpqdHqBg",
-                    "Flames": "4OX9OmWAMtqnTwOoJdAGJDCCSIxkLUJ8GddxLIktcTBnvgrOLmmRs47trSqn1lutHX2i20OfeSEKFw",
-                    "Tiny Cena": "TIuKFxeQfaoTVjO4eItHVUCk2Mt29dE8rrcnfayXBxfbOzHMZdSpA6wFKr0nkfwSpsbQOqoWb4NdDg",
-                    "Aàrón": "Ld9zuHDmL0Cve2fo4jHKCyNfxIpWp5icpKfmUcv8Z4ZcBZrNw_joUUSlQe1DfwVJT2ajPeF3_nYSQw",
-                    "5billon": "Zvrt_wKI2s38YbQ8AqR1HFIHBWmpGxLjwYdNiKq-HLjE85X5gYrkSCE0bpzk2x99exSTNLYQ6pGG1g",
-                    "Nappy": "-PfX7MdJJ0NxdVNqQlrF12d0AjmFS23KrAvaTRsXvvFIkJbFnwT3TdWYTgo9CssoxyB7xa2ySuctZw",
-                    "KingNeptun3": "MxLCh_1d5ULwIJi6cVIEOMIfu7fQqNYqo-dO-qh9wk11AFxwosBC9Un4X0pDxHUj0g3uhiQqx9FI5g",
-                    "cpt stryder": "oJNXgEt6E8MYJoHy6S5PrOHd4oJfsdc1XW7cApIWAxjydmGXGYYocvOrljgWDH5uPBuqrx7s8pGG9g",
-                    "Azote": "GrdcQrR7nTnWYGvp1HoTZV2a2gIk9ADGkzz4j0uL8BgEMNSAnhQhg9qR223oJrQB7KFJ7MxyzFd5Mw",
-                    "MeowMix": "594r9ixu-ditzFfYKBtWeKVawHv-IkgFJwOc4CWb9R7nxlQb-jzhlVk-KRQoISra7rFh23-ws2HlkA",
-                    "Skrt Skrt Skaarl": "P8EwFkRrmnA3lnnpuMMaBiDCwXLPfYsM8F7_wakaZc-Zua7NUZL00cGQB_nXtbNZD0KX3QJixrJQxg",
-                    "Maa san": "2u8or1v3-TukqKh4GC4j5eA62G9_AhpSlASXCzepyKrXjU46WcHo0aIXSabysuhliUzCfVwS-NFpEQ",
-                    "Smoking hookah": "Pu0hBsiBlXfsgkqCv8qXwErNenz2ghnY0xmd9hE6pYYNsLOQ67mwyrdIo_TtLXC_-VXWjhOZvmmXQg",
-                    "Angel": "_gBSbjETzUy-L7z0ulVTDGCqBt8OZq8ijnmE1DbRtQvqjQL-KHv3pal-J-zebz6e7xonrP7Uj72FWw",
-                    "Mews": "dt48TesPGVAvfYPlS6dVj_xyIBR2ofXrjKlUx4a0wWjDOy8xMlP8o69cvTlvRcKquLWy2fHdWC4S6g",
-                    "Oogli": "bcJffLKBPlQcmDjpzqONA1C2Xi__8gcGTTsztJKfbdLqKJXtEVpueU_wJO50EmkfWL69g83hgmhJsA",
-                    "Rogier": "qcLZ9QM2ryS9ZqJ1c4SFp9TtsQZNzFkSCV_FFboEoRmPp7RKoti9MKFdBbJi5MUBtH8Gf3cRYuVa1g",
-                    "Zotto": "2k-ZNd4zdGgCfZcXPNnuyW-nxFu5wcThNvsyYRadjDR0zNzUEjjoCeLNGeUYOg5Koffhswo27wo65w",
-                    "Evelynn Toes": "h_jfYJ8GFfUMr1nb66sBkjwz5Vf4oGCZlBfswyYbjBF-vlVAVSnz4UfZvrYpBJ87kQNoHjyt7WsQaQ",
-                    "Shrektangle": "MPreoO0AdwdNs6QUAZmcapcrIfTiE-Dvnojnn-xzG2meRUWfMBvDjHJbBcKTX60-Otn03GZ3ft_wCg",
-                    "Wazzaii": "D4FHZrU4kI18MTknmLCovx8MGKPtEj4bu4r8wnE11hC3mOOv_wMydINpU-X9-AggC_XScg_hCTzw5Q",
-                    "Chopin": "s1CW7MFK4kZVp1atPOEwFNFz6JcnDLK959jxKF3zhzC8ZoBdX_ECQCAomwW1Zu8OTEEShcWKKmIulg",
-                    "Andrei": "IOk4KhW2pzAQ_cLwBHxBnY9t9288xIV81Plh3SJr4oZp2UMEBUnic-_EFsJ13UcoXVnLsKhbNl2Pkg",
-                    "Drzoan" : "PDi4SDbk0bT6SQ2lR3bxhABkvRCtygH27k2q2bXod4ADrqzADEIyiC2CqhpTMU7TctdzYeQNrPdQpg",
-                    "Billie": "Vj1sKPh65ZuqB_hEL-9UM7JyV7Mbsv6BNGCuMiVovdgbSdJdrYyQSAmCKM5WusIwUO8zSepgOT28yQ"
-                    }
-
-summoner_names_list = ["Simon","Settupss", "Classiq", "Wallaby", "Sehnbon", "Gourish", "Ramza",
-                        "Gabyumi", "meyst", "Limi", "Z3Sleeper", "BlackDrag", "Flames",
-                        "Tiny Cena", "Aàrón", "5billon", "KingNeptun3", "cpt stryder",
-                        "Azote", "Skrt Skrt Skaarl", "Maa san", "Smoking hookah", "Angel", "Oogli", "Rogier", "Zotto",
-                        "Evelynn Toes", "Shrektangle", "Wazzaii", "Chopin", "Andrei", "Drzoan",
-                        "Billie", "Mews" ] # "Nappy" "MeowMix"
+# Player identities (Discord mentions, TFT/LoL PUUIDs) live in roster.json and are hot-reloaded by the bot.
 
 ranks = {
     "IRON IV": 1, "IRON III": 2, "IRON II": 3, "IRON I": 4,
@@ -13,6 +13,11 @@ from dotenv import load_dotenv
 load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s:%(levelname)s:%(name)s: %(message)s')
 
+# Imported only after logging is configured: loading config builds the player registry,
+# which logs, and the first log call would otherwise set up logging at WARNING level
+import config
+from utils import MessageTriggerRegistry
+
 # =================================================================================
 # BOT INITIALIZATION
 # =================================================================================
@@ -26,38 +31,29 @@ bot = commands.Bot(command_prefix="!", intents=intents)
 # GENERAL EVENTS & COMMANDS
 # =================================================================================
 
+# Built once at startup: attachments are read into memory here, not on every message
+message_triggers = MessageTriggerRegistry(config.MESSAGE_TRIGGERS)
+
+
 @bot.event
 async def on_message(message):
     """Handles custom message responses."""
     if message.author == bot.user:
         return
 
-    message_lower = message.content.lower()
-
-    # Example commands, keeping them simple
-    responses = {
-        'poggiesxdd': ("<:POGGIES:926135482360950824>", None),
-        'pogo': (None, "img/UNRANKED.png"),
-        'tpogo': (None, "img/tpogo.png"),
-        'huhpogo': (None, "img/huhpogo.gif"),
-        'caughtpogo': (None, "img/caughtpogo.png"),
-        'bigcaughtpogo': (None, "img/bigcaughtpogo.png"),
-        'pogoflickleave': (None, "img/pogo_flick_leave.gif")
-    }
-
-    if message_lower in responses:
-        await message.delete()
-        content, file_path = responses[message_lower]
-        if file_path:
-            await message.channel.send(content, file=discord.File(file_path))
-        else:
-            await message.channel.send(content)
-
-    if message_lower == "is gourish a noob ?":
-        target_user = bot.get_user(700837976544116808)
-        await message.channel.send(file=discord.File("assets/img/tpogo.png"))
-        if target_user:
-            await message.channel.send(f"YES! {target_user.mention} IS A NOOB! AGREED!")
+    trigger = message_triggers.match(message.content, message.channel.id)
+    if trigger:
+        try:
+            if trigger.delete_message:
+                await message.delete()
+            if trigger.content or trigger.file_bytes is not None:
+                await message.channel.send(trigger.content, file=trigger.make_file())
+            if trigger.followup:
+                target_user = bot.get_user(trigger.followup_user_id) if trigger.followup_user_id else None
+                if target_user:
+                    await message.channel.send(trigger.followup.format(mention=target_user.mention))
+        except discord.HTTPException as e:
+            logging.error(f"Failed to respond to message trigger '{trigger.trigger}': {e}")
 
     await bot.process_commands(message)
 
@@ -68,18 +64,19 @@ async def main():
     """The main entry point for the bot."""
     # Load environment variables for API keys
     discord_token = os.environ.get("DISCORD_TOKEN")
-    tft_api_key = os.environ.get("TFT_API_KEY")
-    lol_api_key = os.environ.get("LOL_API_KEY")
+    # Several keys per game can be given, comma-separated, to spread the request load
+    tft_api_keys = [key.strip() for key in os.environ.get("TFT_API_KEY", "").split(",") if key.strip()]
+    lol_api_keys = [key.strip() for key in os.environ.get("LOL_API_KEY", "").split(",") if key.strip()]
 
-    if not all([discord_token, tft_api_key, lol_api_key]):
+    if not all([discord_token, tft_api_keys, lol_api_keys]):
         logging.critical(
             "FATAL: Missing one or more required environment variables (DISCORD_TOKEN, TFT_API_KEY, LOL_API_KEY).")
         print("Error: Missing required environment variables. Check your .env file.")
         return
 
     # Attach API keys to the bot object so cogs can access them
-    bot.tft_api_key = tft_api_key
-    bot.lol_api_key = lol_api_key
+    bot.tft_api_keys = tft_api_keys
+    bot.lol_api_keys = lol_api_keys
 
     # Load the leaderboard cog
     # The path uses dots, not slashes. 'cogs.leaderboard_cog' refers to cogs/leaderboard_cog.py
@@ -87,6 +84,7 @@ async def main():
         logging.info("Loading cogs...")
         await bot.load_extension("cogs.leaderboard_cog")
         await bot.load_extension("cogs.security_cog")
+        await bot.load_extension("cogs.chart_cog")
         logging.info("All cogs loaded successfully.")
     except Exception as e:
         logging.critical(f"Failed to load a cog: {e}", exc_info=True)
@@ -1,2 +1,11 @@
 from .api_client import RiotAPIClient
-from .image_generator import ImageGenerator
\ No newline at end of file
+from .image_generator import ImageGenerator
+from .single_flight import SingleFlight
+from .player_registry import Player, PlayerRegistry, load_roster
+from .identity_cache import IdentityCache
+from .message_triggers import MessageTrigger, MessageTriggerRegistry
+from .rank_history import RankHistory
+from .chart_generator import ChartGenerator
+from .match_history import MatchHistoryStore, summarize_match
+from .rank_changes import RankChangeDetector, RankChangeEvent, SnapshotRecorder, diff_rankings, load_snapshots
+from .rate_limiter import RateBudget
\ No newline at end of file
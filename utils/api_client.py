@@ -3,63 +3,263 @@
 import aiohttp
 import logging
 import asyncio # Required for the retry delay
+from urllib.parse import quote
+
+from .rate_limiter import RateBudget
+from .single_flight import SingleFlight
+
+# Platform (where ranked data lives) -> regional routing host (where match history lives)
+PLATFORM_ROUTING = {
+    "na1": "americas", "br1": "americas", "la1": "americas", "la2": "americas",
+    "euw1": "europe", "eun1": "europe", "tr1": "europe", "ru": "europe", "me1": "europe",
+    "kr": "asia", "jp1": "asia",
+    "oc1": "sea", "ph2": "sea", "sg2": "sea", "th2": "sea", "tw2": "sea", "vn2": "sea",
+}
+
+# Development key limits; production keys can pass their own
+DEFAULT_RATE_LIMITS = [(20, 1), (100, 120)]
+
 
 class RiotAPIClient:
-    def __init__(self, api_key: str, region: str):
-        self.api_key = api_key
+    """
+    Riot API client for one game. Each request is routed to the host of the player's
+    platform, with one connection pool per host and one rate budget per (key, host)
+    (Riot enforces rate limits per key and per routing host).
+    Several keys can be given to spread the load. PUUIDs are encrypted per key, so a
+    player is pinned to one key and every request about them is sent with it (`key_index`).
+    """
+
+    def __init__(self, api_keys: list[str] | str, region: str, account_region: str = "americas",
+                 rate_limits: list[tuple[int, float]] | None = None, connections_per_host: int = 10):
+        self.api_keys = [api_keys] if isinstance(api_keys, str) else list(api_keys)
+        self.headers = [{"X-Riot-Token": api_key} for api_key in self.api_keys]
+        # Default platform, for players without a region of their own
         self.region = region
-        self.headers = {"X-Riot-Token": self.api_key}
+        # Account-v1 (Riot ID lookups) is global data and can be asked to any regional host
+        self.account_region = account_region
+        self.rate_limits = rate_limits or DEFAULT_RATE_LIMITS
+        self.connections_per_host = connections_per_host
+        self.budgets: dict[tuple[int, str], RateBudget] = {}  # (key index, host) -> budget
+        self.sessions: dict[str, aiohttp.ClientSession] = {}  # host -> pooled session
+        # Concurrent identical requests share one HTTP call. Ranked keys are bounded by
+        # the roster, so their stats are kept per player; match and account keys are not.
+        self.single_flight = SingleFlight(per_key_kinds=("ranked",))
+
+    @property
+    def key_count(self) -> int:
+        return len(self.api_keys)
+
+    async def close(self):
+        """Closes every pooled connection."""
+        for session in self.sessions.values():
+            await session.close()
+        self.sessions.clear()
+
+    # --- Routing ---
+    def _platform(self, platform: str | None) -> str:
+        return platform or self.region
 
-    async def get_ranked_stats_by_puuid(self, puuid: str, game_type: str) -> list | None:
-        """Fetches ranked stats for a PUUID for either LoL or TFT with retry logic."""
+    def _regional_route(self, platform: str | None) -> str:
+        """The regional routing host for a platform, e.g. "euw1" -> "europe"."""
+        platform = self._platform(platform)
+        route = PLATFORM_ROUTING.get(platform)
+        if route is None:
+            logging.warning(f"Unknown platform '{platform}', using {self.account_region} for match history.")
+            return self.account_region
+        return route
+
+    def _match_route(self, match_id: str) -> str:
+        """Match ids start with their platform (e.g. "EUW1_1234"), which tells where the match lives."""
+        platform = match_id.split("_", 1)[0].lower() if "_" in match_id else None
+        return self._regional_route(platform)
+
+    def _session(self, host: str) -> aiohttp.ClientSession:
+        session = self.sessions.get(host)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=self.connections_per_host)
+            session = self.sessions[host] = aiohttp.ClientSession(connector=connector)
+        return session
+
+    async def _acquire_budget(self, host: str, key_index: int) -> RateBudget:
+        """Waits until the key has budget left on `host` and reserves a request on it."""
+        budget = self.budgets.get((key_index, host))
+        if budget is None:
+            budget = self.budgets[(key_index, host)] = RateBudget(self.rate_limits)
+        while (wait := budget.wait_time()) > 0:
+            await asyncio.sleep(wait)
+        budget.consume()
+        return budget
+
+    def get_budget_stats(self) -> dict:
+        """Requests sent per key and host, for logging (e.g. "euw1" or "euw1#2" for the second key)."""
+        return {host if index == 0 else f"{host}#{index + 1}": budget.requests_made
+                for (index, host), budget in self.budgets.items()}
+
+    async def get_ranked_stats_by_puuid(self, puuid: str, game_type: str, platform: str | None = None,
+                                        key_index: int = 0) -> list | None:
+        """
+        Fetches ranked stats for a PUUID for either LoL or TFT, from the player's platform.
+        Concurrent callers asking for the same player await a single in-flight request.
+        """
+        return await self.single_flight.do(
+            ("ranked", game_type, puuid), self._fetch_ranked_stats, puuid, game_type, platform, key_index
+        )
+
+    async def _fetch_ranked_stats(self, puuid: str, game_type: str, platform: str | None,
+                                  key_index: int) -> list | None:
+        """Performs the actual ranked stats request."""
         if game_type == "LoL":
-            url = f"https://{self.region}.api.riotgames.com/lol/league/v4/entries/by-puuid/{puuid}"
+            path = f"/lol/league/v4/entries/by-puuid/{puuid}"
         elif game_type == "TFT":
-            url = f"https://{self.region}.api.riotgames.com/tft/league/v1/by-puuid/{puuid}"
+            path = f"/tft/league/v1/by-puuid/{puuid}"
         else:
             logging.error(f"Invalid game_type provided: {game_type}")
             return None
 
+        # A 404 here means the player is unranked
+        return await self._get_json(self._platform(platform), path, puuid, not_found_value=[], key_index=key_index)
+
+    async def get_account_by_riot_id(self, game_name: str, tag_line: str, key_index: int = 0) -> dict | None:
+        """
+        Resolves a Riot ID (gameName#tagLine) to an account, including the PUUID for the given API key.
+        Returns {} if no such account exists, None if the request failed.
+        """
+        path = f"/riot/account/v1/accounts/by-riot-id/{quote(game_name, safe='')}/{quote(tag_line, safe='')}"
+        key = ("account", game_name.casefold(), tag_line.casefold(), key_index)
+        return await self.single_flight.do(
+            key, self._get_json, self.account_region, path, f"{game_name}#{tag_line}", {}, key_index
+        )
+
+    async def get_account_by_puuid(self, puuid: str, key_index: int = 0) -> dict | None:
+        """Fetches the current Riot ID of a PUUID, used to pick up name changes."""
+        path = f"/riot/account/v1/accounts/by-puuid/{puuid}"
+        return await self.single_flight.do(
+            ("account", puuid), self._get_json, self.account_region, path, puuid, {}, key_index
+        )
+
+    async def get_match_ids(self, puuid: str, game_type: str, start: int = 0, count: int = 20,
+                            platform: str | None = None, key_index: int = 0) -> list | None:
+        """Fetches a page of a player's match ids, newest first, from their platform's regional host."""
+        if game_type == "LoL":
+            # Ranked Solo/Duo only (queue 420), the queue our leaderboard tracks
+            path = f"/lol/match/v5/matches/by-puuid/{puuid}/ids?queue=420&start={start}&count={count}"
+        elif game_type == "TFT":
+            path = f"/tft/match/v1/matches/by-puuid/{puuid}/ids?start={start}&count={count}"
+        else:
+            logging.error(f"Invalid game_type provided: {game_type}")
+            return None
+        route = self._regional_route(platform)
+        return await self._get_json(route, path, f"match ids of {puuid}", not_found_value=[], key_index=key_index)
+
+    async def get_match(self, match_id: str, game_type: str, key_index: int = 0) -> dict | None:
+        """
+        Fetches one match. Roster players on the same key who played together share a single
+        request; the participants' PUUIDs in the response are encrypted for that key.
+        """
+        game_path = "lol/match/v5" if game_type == "LoL" else "tft/match/v1"
+        path = f"/{game_path}/matches/{match_id}"
+        return await self.single_flight.do(
+            ("match", match_id, key_index), self._get_json, self._match_route(match_id), path, match_id, {}, key_index
+        )
+
+    async def fetch_new_matches(self, puuid: str, game_type: str, last_match_id: str | None,
+                                initial_count: int = 5, page_size: int = 20, max_pages: int = 3,
+                                platform: str | None = None, max_concurrency: int = 4,
+                                key_index: int = 0) -> tuple[list, str | None] | None:
+        """
+        Incrementally fetches the matches a player played since `last_match_id`, oldest first.
+        Match ids are paged newest first until the cursor is found, so the cost is proportional
+        to games played. Without a cursor, only the latest `initial_count` matches are fetched.
+        Returns (matches, new cursor), or None if the match id lookup failed. If a match's details
+        fail, it and everything newer are left for next time so the cursor never skips a match.
+        At most `max_concurrency` match detail requests are in flight at once.
+        """
+        new_ids = []
+        for page in range(max_pages):
+            ids = await self.get_match_ids(puuid, game_type, start=page * page_size, count=page_size,
+                                           platform=platform, key_index=key_index)
+            if ids is None:
+                return None
+            if last_match_id is None:
+                new_ids = ids[:initial_count]
+                break
+            if last_match_id in ids:
+                new_ids.extend(ids[:ids.index(last_match_id)])
+                break
+            new_ids.extend(ids)
+            if len(ids) < page_size:
+                break
+
+        if not new_ids:
+            return [], last_match_id
+
+        oldest_first = list(reversed(new_ids))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_match(match_id):
+            async with semaphore:
+                return await self.get_match(match_id, game_type, key_index)
+
+        details = await asyncio.gather(*(get_match(match_id) for match_id in oldest_first))
+        matches, cursor = [], last_match_id
+        for match_id, match in zip(oldest_first, details):
+            if match is None:
+                break  # Request failed; retry from here next time
+            if match:  # {} means the match no longer exists; just move past it
+                matches.append(match)
+            cursor = match_id
+        return matches, cursor
+
+    async def _get_json(self, host: str, path: str, description: str, not_found_value=None, key_index: int = 0):
+        """
+        GETs a Riot API path on a routing host (platform like "euw1" or region like "europe")
+        with the given key, with retry logic. Returns `not_found_value` on 404, None on failure.
+        """
         MAX_RETRIES = 3
+        url = f"https://{host}.api.riotgames.com{path}"
         for attempt in range(MAX_RETRIES):
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.get(url, headers=self.headers) as response:
-                        # Specifically handle rate limit error (429)
-                        if response.status == 429:
-                            retry_after = int(response.headers.get("Retry-After", "1"))
-                            logging.warning(
-                                f"Rate limited on attempt {attempt + 1}/{MAX_RETRIES}. "
-                                f"Retrying after {retry_after} seconds..."
-                            )
+            budget = await self._acquire_budget(host, key_index)
+            try:
+                async with self._session(host).get(url, headers=self.headers[key_index]) as response:
+                    # Specifically handle rate limit error (429)
+                    if response.status == 429:
+                        retry_after = int(response.headers.get("Retry-After", "1"))
+                        logging.warning(
+                            f"Rate limited on {host} on attempt {attempt + 1}/{MAX_RETRIES}. "
+                            f"Retrying after {retry_after} seconds..."
+                        )
+                        if response.headers.get("X-Rate-Limit-Type") in ("application", "method"):
+                            # This key is out of budget on this host: pause every request it sends there
+                            budget.block_for(retry_after)
+                        else:
                             await asyncio.sleep(retry_after)
-                            continue  # Go to the next attempt in the for loop
+                        continue  # Go to the next attempt in the for loop
 
-                        # The original 404 handling is a final state (player is unranked), not an error to retry
-                        if response.status == 404:
-                            return []
+                    # A 404 is a final answer from the API, not an error to retry
+                    if response.status == 404:
+                        return not_found_value
 
-                        # Raise an exception for other bad responses (e.g., 5xx server errors)
-                        response.raise_for_status()
+                    # Raise an exception for other bad responses (e.g., 5xx server errors)
+                    response.raise_for_status()
 
-                        # If the request was successful, return the JSON data
-                        return await response.json()
+                    # If the request was successful, return the JSON data
+                    return await response.json()
 
-                except aiohttp.ClientError as e:
-                    # Catches other client-side errors like connection issues to be retried
-                    logging.warning(
-                        f"Request for {puuid} failed on attempt {attempt + 1}/{MAX_RETRIES}: {e}"
-                    )
-                except Exception as e:
-                    # Catch any other unexpected errors, log, and retry
-                    logging.warning(
-                        f"An unexpected error occurred for {puuid} on attempt {attempt + 1}/{MAX_RETRIES}: {e}"
-                    )
+            except aiohttp.ClientError as e:
+                # Catches other client-side errors like connection issues to be retried
+                logging.warning(
+                    f"Request for {description} failed on attempt {attempt + 1}/{MAX_RETRIES}: {e}"
+                )
+            except Exception as e:
+                # Catch any other unexpected errors, log, and retry
+                logging.warning(
+                    f"An unexpected error occurred for {description} on attempt {attempt + 1}/{MAX_RETRIES}: {e}"
+                )
 
             # Wait for a short period before the next retry to avoid hammering the server
             if attempt < MAX_RETRIES - 1:
                 await asyncio.sleep(1)
 
         # This part is reached only if all retries fail
-        logging.error(f"Failed to fetch stats for {puuid} after {MAX_RETRIES} retries.")
-        return None
\ No newline at end of file
+        logging.error(f"Failed to fetch {description} after {MAX_RETRIES} retries.")
+        return None
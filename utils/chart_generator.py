@@ -0,0 +1,211 @@
+# utils/chart_generator.py
+
+import colorsys
+import io
+import logging
+import math
+from datetime import datetime
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+
+class ChartLayoutConfig:
+    IMAGE_SIZE = (1366, 757)
+    BACKGROUND_COLOR = (24, 25, 28, 255)
+    GRID_COLOR = (70, 72, 78, 255)
+    TEXT_COLOR = (230, 230, 230, 255)
+
+    # Plot area (left, top, right, bottom)
+    PLOT_BOX = (110, 70, 1110, 700)
+    LEGEND_X = 1130
+    LEGEND_ROW_HEIGHT = 30  # Rows fill the plot height, then continue in another legend column
+
+    FONT_SIZE_TITLE = 34
+    FONT_SIZE_LABEL = 20
+
+    LINE_WIDTH = 3
+    # Longer series are downsampled (LTTB) to about this many points; more than a
+    # few per horizontal pixel can't be seen anyway.
+    MAX_POINTS_PER_SERIES = 400
+
+    SERIES_COLORS = [
+        (230, 25, 75), (60, 180, 75), (255, 225, 25), (67, 99, 216), (245, 130, 49),
+        (145, 30, 180), (66, 212, 244), (240, 50, 230), (191, 239, 69), (250, 190, 212),
+        (70, 153, 144), (220, 190, 255), (154, 99, 36), (255, 250, 200), (128, 0, 0),
+        (170, 255, 195), (128, 128, 0), (255, 216, 177), (0, 0, 117), (169, 169, 169),
+    ]
+
+
+def lttb_downsample(x: np.ndarray, y: np.ndarray, threshold: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling, fully vectorized with NumPy.
+    Keeps the visual shape of a long series with `threshold` points. Classic LTTB uses the
+    previously *selected* point as a triangle vertex, which forces a Python loop over buckets;
+    here the previous bucket's average is used instead, so every bucket is solved at once.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    # threshold - 2 buckets between the fixed first and last point; edges are strictly
+    # increasing because n > threshold.
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    counts = np.diff(edges)
+    bucket_of = np.repeat(np.arange(threshold - 2), counts)
+
+    # Average of every bucket, with the first and last point as their own "buckets" at both ends
+    avg_x = np.concatenate(([x[0]], np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts, [x[-1]]))
+    avg_y = np.concatenate(([y[0]], np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts, [y[-1]]))
+
+    # Triangle (previous bucket average, point, next bucket average) for every inner point
+    ax, ay = avg_x[bucket_of], avg_y[bucket_of]
+    cx, cy = avg_x[bucket_of + 2], avg_y[bucket_of + 2]
+    bx, by = x[1:n - 1], y[1:n - 1]
+    areas = np.abs((ax - cx) * (by - ay) - (ax - bx) * (cy - ay))
+
+    # Index of the largest triangle in each bucket: sort by (bucket, -area), take each bucket's first
+    order = np.lexsort((-areas, bucket_of))
+    first_in_bucket = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    selected = np.concatenate(([0], order[first_in_bucket] + 1, [n - 1]))
+
+    return x[selected], y[selected]
+
+
+def series_colors(count: int) -> list[tuple]:
+    """
+    `count` distinct line colors. Up to len(SERIES_COLORS) the hand-picked palette is used;
+    beyond that, hues are spread evenly with alternating saturation and brightness so
+    neighbouring hues stay apart.
+    """
+    palette = ChartLayoutConfig.SERIES_COLORS
+    if count <= len(palette):
+        return palette[:count]
+    colors = []
+    for i in range(count):
+        saturation = (0.85, 0.55)[i % 2]
+        value = (1.0, 0.8, 0.6)[i % 3]
+        r, g, b = colorsys.hsv_to_rgb(i / count, saturation, value)
+        colors.append((int(r * 255), int(g * 255), int(b * 255)))
+    return colors
+
+
+class ChartGenerator:
+    """Draws LP-over-time charts with the same Pillow stack and fonts as ImageGenerator."""
+
+    def __init__(self, font_path: str, ranks: dict):
+        try:
+            self.layout = ChartLayoutConfig()
+            self.font_title = ImageFont.truetype(font_path, self.layout.FONT_SIZE_TITLE)
+            self.font_label = ImageFont.truetype(font_path, self.layout.FONT_SIZE_LABEL)
+        except IOError:
+            logging.error(f"Could not load font from path: {font_path}. Please ensure the font file exists.")
+            raise
+
+        # Rank value where each tier starts (e.g. "GOLD" -> GOLD IV * 100), sorted ascending.
+        # MASTER, GRANDMASTER and CHALLENGER share one value, so they become a single "MASTER+" line.
+        tier_starts = {}
+        for tier_division, value in ranks.items():
+            tier = tier_division.split()[0]
+            tier_starts[tier] = min(tier_starts.get(tier, value), value)
+        boundaries = {}
+        for tier, value in tier_starts.items():
+            boundaries.setdefault(value * 100, []).append(tier)
+        self.boundary_values = np.array(sorted(boundaries), dtype=np.float64)
+        self.boundary_labels = [
+            "MASTER+" if len(boundaries[v]) > 1 else boundaries[v][0] for v in sorted(boundaries)
+        ]
+
+    def generate_lp_chart(self, series: list, start_ts: float, end_ts: float, title: str) -> io.BytesIO | None:
+        """
+        Draws one line per player and returns the PNG as a BytesIO object.
+        `series` is a list of (label, points) where points are [[timestamp, rank_value], ...].
+        """
+        try:
+            layout = self.layout
+            left, top, right, bottom = layout.PLOT_BOX
+            width, height = right - left, bottom - top
+
+            image = Image.new("RGBA", layout.IMAGE_SIZE, layout.BACKGROUND_COLOR)
+            draw = ImageDraw.Draw(image)
+            draw.text((left, 15), title, fill=layout.TEXT_COLOR, font=self.font_title)
+
+            # --- Vectorized preparation of every series ---
+            prepared = []
+            for label, points in series:
+                if not points:
+                    continue
+                arr = np.asarray(points, dtype=np.float64)
+                t, v = arr[:, 0], arr[:, 1]
+                # Rank values are step functions: a value holds until the next change.
+                # Duplicate each point so the line is drawn as steps, then extend to the end of the range.
+                t = np.append(np.repeat(t, 2)[1:], end_ts)
+                v = np.repeat(v, 2)
+                t = np.clip(t, start_ts, end_ts)
+                t, v = lttb_downsample(t, v, layout.MAX_POINTS_PER_SERIES)
+                prepared.append((label, t, v))
+
+            if not prepared:
+                draw.text((left, top), "No ranked data for this range yet.", fill=layout.TEXT_COLOR, font=self.font_label)
+                return self._to_buffer(image)
+
+            all_values = np.concatenate([v for _, _, v in prepared])
+            v_min, v_max = float(all_values.min()), float(all_values.max())
+            padding = max(50.0, (v_max - v_min) * 0.05)
+            v_min, v_max = v_min - padding, v_max + padding
+            t_span = max(end_ts - start_ts, 1.0)
+
+            # --- Rank boundaries visible in the value range ---
+            lo, hi = np.searchsorted(self.boundary_values, [v_min, v_max])
+            boundary_y = bottom - (self.boundary_values[lo:hi] - v_min) / (v_max - v_min) * height
+            for y, label in zip(boundary_y.tolist(), self.boundary_labels[lo:hi]):
+                draw.line([(left, y), (right, y)], fill=layout.GRID_COLOR, width=1)
+                draw.text((10, y - 12), label, fill=layout.TEXT_COLOR, font=self.font_label)
+
+            # --- Time axis labels ---
+            for fraction in np.linspace(0.0, 1.0, 5):
+                x = left + fraction * width
+                label = datetime.fromtimestamp(start_ts + fraction * t_span).strftime("%b %d")
+                draw.line([(x, bottom), (x, bottom + 6)], fill=layout.GRID_COLOR, width=1)
+                draw.text((x - 20, bottom + 10), label, fill=layout.TEXT_COLOR, font=self.font_label)
+            draw.rectangle(layout.PLOT_BOX, outline=layout.GRID_COLOR, width=1)
+
+            # --- Lines and legend ---
+            colors = series_colors(len(prepared))
+            rows_per_column = max(1, (bottom - top) // layout.LEGEND_ROW_HEIGHT)
+            legend_columns = math.ceil(len(prepared) / rows_per_column)
+            column_width = (layout.IMAGE_SIZE[0] - layout.LEGEND_X) // legend_columns
+            for i, (label, t, v) in enumerate(prepared):
+                color = colors[i]
+                xs = left + (t - start_ts) / t_span * width
+                ys = bottom - (v - v_min) / (v_max - v_min) * height
+                coords = np.column_stack((xs, ys)).ravel().tolist()
+                if len(coords) >= 4:
+                    draw.line(coords, fill=color, width=layout.LINE_WIDTH, joint="curve")
+
+                legend_x = layout.LEGEND_X + (i // rows_per_column) * column_width
+                legend_y = top + (i % rows_per_column) * layout.LEGEND_ROW_HEIGHT
+                draw.rectangle((legend_x, legend_y + 6, legend_x + 14, legend_y + 20), fill=color)
+                label = self._fit_label(label, column_width - 26)
+                draw.text((legend_x + 20, legend_y), label, fill=layout.TEXT_COLOR, font=self.font_label)
+
+            return self._to_buffer(image)
+
+        except Exception as e:
+            logging.error(f"An error occurred during chart generation: {e}")
+            return None
+
+    def _fit_label(self, label: str, max_width: int) -> str:
+        """Shortens a legend label until it fits in its legend column."""
+        if self.font_label.getlength(label) <= max_width:
+            return label
+        while len(label) > 1 and self.font_label.getlength(label + ".") > max_width:
+            label = label[:-1]
+        return label + "."
+
+    @staticmethod
+    def _to_buffer(image: Image.Image) -> io.BytesIO:
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        buffer.seek(0)
+        return buffer
@@ -0,0 +1,122 @@
+# utils/identity_cache.py
+
+import json
+import logging
+import os
+import time
+
+
+class IdentityCache:
+    """
+    Persistent Riot ID -> PUUID cache, stored as JSON on disk.
+    PUUIDs are encrypted per API key, so entries are kept separately per game type
+    (TFT and LoL use different keys), and each entry records the index of the key
+    (in TFT_API_KEY / LOL_API_KEY) its PUUID belongs to. That also pins the player to
+    that key. Each entry remembers when it was last checked against the API so it can
+    be revalidated periodically.
+    """
+
+    # Roster entry fields filled in per game: (game type, PUUID field, key index field)
+    FIELDS = (("TFT", "tft_puuid", "tft_key"), ("LoL", "lol_puuid", "lol_key"))
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: dict[str, dict[str, dict]] = {}
+        self._load()
+
+    @staticmethod
+    def _key(riot_id: str) -> str:
+        """Riot IDs are case-insensitive, e.g. "Simon#NA1" == "simon#na1"."""
+        return riot_id.strip().casefold()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            self.entries = {}
+        except (OSError, ValueError) as e:
+            logging.error(f"Could not read identity cache {self.path}, starting empty: {e}")
+            self.entries = {}
+
+    def save(self):
+        """Writes the cache atomically so a crash mid-write never corrupts it."""
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, indent=4, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.error(f"Could not write identity cache {self.path}: {e}")
+
+    def get_puuid(self, game_type: str, riot_id: str) -> tuple[str, int] | None:
+        """Returns (PUUID, key index) of a cached Riot ID."""
+        entry = self.entries.get(game_type, {}).get(self._key(riot_id))
+        # Entries written before multiple keys were supported all belong to the first key
+        return (entry["puuid"], entry.get("key", 0)) if entry else None
+
+    def set_puuid(self, game_type: str, riot_id: str, puuid: str, key_index: int = 0):
+        self.entries.setdefault(game_type, {})[self._key(riot_id)] = {
+            "riot_id": riot_id,
+            "puuid": puuid,
+            "key": key_index,
+            "checked_at": time.time(),
+        }
+
+    def mark_checked(self, game_type: str, riot_id: str):
+        """Moves an entry to the back of the revalidation queue without changing it."""
+        entry = self.entries.get(game_type, {}).get(self._key(riot_id))
+        if entry:
+            entry["checked_at"] = time.time()
+
+    def prune(self, entries: list) -> int:
+        """
+        Drops cached identities that no roster entry uses anymore, so they aren't revalidated forever.
+        An entry is kept if its Riot ID is in the roster or its PUUID belongs to a roster player
+        (e.g. the new name of a player whose roster entry still has the old one).
+        Returns the number of removed entries.
+        """
+        riot_ids = {self._key(entry["riot_id"]) for entry in entries if entry.get("riot_id")}
+        filled = self.fill_entries(entries)
+        removed = 0
+        for game_type, field, _ in self.FIELDS:
+            puuids = {entry.get(field) for entry in filled} - {None}
+            cached = self.entries.get(game_type, {})
+            for key in [k for k, e in cached.items() if k not in riot_ids and e["puuid"] not in puuids]:
+                del cached[key]
+                removed += 1
+        return removed
+
+    def get_stale(self, game_type: str, max_age_seconds: float) -> list[dict]:
+        """Returns the entries of a game type that haven't been checked within `max_age_seconds`."""
+        cutoff = time.time() - max_age_seconds
+        entries = self.entries.get(game_type, {}).values()
+        return sorted((e for e in entries if e["checked_at"] < cutoff), key=lambda e: e["checked_at"])
+
+    def fill_entries(self, entries: list, key_counts: dict[str, int] | None = None) -> list:
+        """
+        Fills in missing PUUIDs of roster entries that have a "riot_id" from the cache, along with
+        the index of the key they belong to ("tft_key"/"lol_key"). Explicit PUUIDs in the roster always
+        win and belong to the roster's "api_key" (default 0). A cached PUUID is left out if it belongs
+        to another key than the roster's "api_key", or to a key beyond `key_counts[game_type]`,
+        so it gets resolved again. Returns new entry dicts.
+        """
+        filled = []
+        for entry in entries:
+            entry = dict(entry)
+            wanted_key = entry.get("api_key")
+            for game_type, field, key_field in self.FIELDS:
+                if entry.get(field):
+                    entry[key_field] = wanted_key or 0
+                    continue
+                cached = self.get_puuid(game_type, entry["riot_id"]) if entry.get("riot_id") else None
+                if cached is None:
+                    continue
+                puuid, key_index = cached
+                if wanted_key is not None and key_index != wanted_key:
+                    continue
+                if key_counts is not None and key_index >= key_counts[game_type]:
+                    continue
+                entry[field], entry[key_field] = puuid, key_index
+            filled.append(entry)
+        return filled
@@ -1,7 +1,7 @@
 # utils/image_generator.py
 
 import io
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 import logging
 
 
@@ -16,6 +16,7 @@ class LayoutConfig:
     FONT_SIZE_NORMAL = 25
     FONT_SIZE_MEDIUM = 23
     FONT_SIZE_SMALL = 21
+    FONT_SIZE_BADGE = 28
 
     # Base coordinates for the top-left of each column
     COLUMN_X_OFFSETS = [70, 513, 956]
@@ -29,6 +30,28 @@ class LayoutConfig:
     RANK_ICON_OFFSET = (165, 225)  # Default Y, will be adjusted
     RANK_TEXT_OFFSET = (237, 235)
 
+    # "Page x/y" label, only drawn when the roster needs more than one page
+    PAGE_LABEL_POS = (1250, 715)
+
+    # The background styles the top 4 slots (gold, silver, bronze, grey). Pages after the first
+    # use a copy where those slots are replaced by the plain slot below them.
+    STYLED_SLOTS = 4
+    SLOT_BOX = (100, 215, 460, 282)  # Column 0 bar, relative to the row's Y offset
+
+    # Position badges baked into the background (1ST to 21ST). Pages after the first
+    # draw a plain badge with the real position over them.
+    BADGE_CENTER_X = [59, 497, 940]  # One per column
+    BADGE_CENTER_Y_OFFSET = 248  # From the row's Y offset
+    BADGE_RADIUS = 34  # Pointy-top hexagon, covers the baked badge and its border
+    BADGE_FILL = (22, 21, 21, 255)
+    BADGE_TEXT_COLOR = (235, 228, 228, 255)
+
+
+def ordinal(position: int) -> str:
+    """1 -> "1ST", 22 -> "22ND", 111 -> "111TH", like the badges on the background."""
+    suffix = "TH" if 10 <= position % 100 <= 20 else {1: "ST", 2: "ND", 3: "RD"}.get(position % 10, "TH")
+    return f"{position}{suffix}"
+
 
 class ImageGenerator:
     """Handles the creation of the leaderboard image."""
@@ -38,15 +61,65 @@ class ImageGenerator:
         Initializes the ImageGenerator by loading fonts.
         This is done once to improve performance.
         """
+        # Resized backgrounds and rank icons, keyed by path / tier, so every page
+        # and every update reuses them instead of reopening files from disk
+        self._backgrounds = {}
+        self._rank_icons = {}
         try:
             self.layout = LayoutConfig()
             self.font_normal = ImageFont.truetype(font_path, self.layout.FONT_SIZE_NORMAL)
             self.font_medium = ImageFont.truetype(font_path, self.layout.FONT_SIZE_MEDIUM)
             self.font_small = ImageFont.truetype(font_path, self.layout.FONT_SIZE_SMALL)
+            self.font_badge = ImageFont.truetype(font_path, self.layout.FONT_SIZE_BADGE)
         except IOError:
             logging.error(f"Could not load font from path: {font_path}. Please ensure the font file exists.")
             raise
 
+    @property
+    def page_size(self) -> int:
+        """How many players fit on one leaderboard image."""
+        return len(self.layout.COLUMN_X_OFFSETS) * len(self.layout.ROW_Y_OFFSETS)
+
+    def paginate(self, rankings: list) -> list[list]:
+        """Splits the full rankings into one list of players per image."""
+        return [rankings[i:i + self.page_size] for i in range(0, len(rankings), self.page_size)]
+
+    def _get_background(self, background_path: str) -> Image.Image:
+        background = self._backgrounds.get(background_path)
+        if background is None:
+            with Image.open(background_path) as source:
+                background = source.convert("RGBA").resize(self.layout.BACKGROUND_SIZE)
+            self._backgrounds[background_path] = background
+        return background
+
+    def _get_plain_background(self, background_path: str) -> Image.Image:
+        """The background with the top-slot styling replaced by plain slots, for pages after the first."""
+        key = (background_path, "plain")
+        background = self._backgrounds.get(key)
+        if background is None:
+            background = self._get_background(background_path).copy()
+            left, top, right, bottom = self.layout.SLOT_BOX
+            plain_row_y = self.layout.ROW_Y_OFFSETS[self.layout.STYLED_SLOTS]
+            plain_slot = background.crop((left, plain_row_y + top, right, plain_row_y + bottom))
+            # Only copy the slot itself (dark, grey pixels), not the artwork around it
+            _, saturation, value = plain_slot.convert("RGB").convert("HSV").split()
+            mask = ImageChops.multiply(saturation.point(lambda v: 255 if v < 40 else 0),
+                                       value.point(lambda v: 255 if v < 90 else 0))
+            for row_y in self.layout.ROW_Y_OFFSETS[:self.layout.STYLED_SLOTS]:
+                background.paste(plain_slot, (left, row_y + top), mask)
+            self._backgrounds[key] = background
+        return background
+
+    def _get_rank_icon(self, tier: str) -> Image.Image:
+        rank_icon = self._rank_icons.get(tier)
+        if rank_icon is None:
+            with Image.open(f"assets/img/{tier}.png") as source:
+                rank_icon = source.convert("RGBA")
+            is_unranked = tier == "UNRANKED"
+            rank_icon.thumbnail(self.layout.UNRANKED_ICON_SIZE if is_unranked else self.layout.RANK_IMAGE_SIZE)
+            self._rank_icons[tier] = rank_icon
+        return rank_icon
+
     def _get_player_font(self, player_name: str) -> ImageFont.FreeTypeFont:
         """Selects the appropriate font size based on the player name's length."""
         if len(player_name) > 12:
@@ -54,7 +127,8 @@ class ImageGenerator:
         return self.font_normal
 
     def _draw_player(self, draw: ImageDraw.Draw, image: Image.Image, player_data: tuple, base_x: int, base_y: int):
-        summoner_name, _, _, tier, tier_division_lp = player_data
+        player, _, _, tier, tier_division_lp = player_data
+        summoner_name = player.name
 
         # Draw Summoner Name
         name_font = self._get_player_font(summoner_name)
@@ -64,18 +138,16 @@ class ImageGenerator:
         # Draw Rank Icon
         icon_path = f"assets/img/{tier.upper()}.png"  # Initialize before try
         try:
-            with Image.open(icon_path).convert("RGBA") as rank_icon:
-                is_unranked = tier.upper() == "UNRANKED"
-                icon_size = self.layout.UNRANKED_ICON_SIZE if is_unranked else self.layout.RANK_IMAGE_SIZE
-                rank_icon.thumbnail(icon_size)
-
-                icon_x = base_x + self.layout.RANK_ICON_OFFSET[0]
-                icon_y_base = base_y + self.layout.RANK_ICON_OFFSET[1]
-                icon_y = icon_y_base - 5 if not is_unranked and tier.upper() not in [
-                    "PLATINUM", "DIAMOND", "MASTER", "GRANDMASTER", "CHALLENGER"
-                ] else icon_y_base
-
-                image.alpha_composite(rank_icon, dest=(icon_x, icon_y))
+            rank_icon = self._get_rank_icon(tier.upper())
+            is_unranked = tier.upper() == "UNRANKED"
+
+            icon_x = base_x + self.layout.RANK_ICON_OFFSET[0]
+            icon_y_base = base_y + self.layout.RANK_ICON_OFFSET[1]
+            icon_y = icon_y_base - 5 if not is_unranked and tier.upper() not in [
+                "PLATINUM", "DIAMOND", "MASTER", "GRANDMASTER", "CHALLENGER"
+            ] else icon_y_base
+
+            image.alpha_composite(rank_icon, dest=(icon_x, icon_y))
         except FileNotFoundError:
             logging.warning(f"Rank icon not found: {icon_path}")
         except Exception as e:
@@ -86,35 +158,59 @@ class ImageGenerator:
         rank_text_pos = (base_x + self.layout.RANK_TEXT_OFFSET[0], base_y + self.layout.RANK_TEXT_OFFSET[1])
         draw.text(rank_text_pos, tier_division_lp, fill="white", font=rank_font)
 
-    def generate_leaderboard_image(self, rankings: list, background_path: str) -> io.BytesIO | None:
+    def _draw_position_badge(self, draw: ImageDraw.Draw, column: int, row_y: int, position: int):
+        """Covers the background's baked-in badge for this slot with one showing `position`."""
+        center = (self.layout.BADGE_CENTER_X[column], row_y + self.layout.BADGE_CENTER_Y_OFFSET)
+        draw.regular_polygon((center, self.layout.BADGE_RADIUS), n_sides=6, rotation=30,
+                             fill=self.layout.BADGE_FILL)
+        label = ordinal(position)
+        font = self.font_badge if len(label) <= 4 else self.font_normal
+        draw.text(center, label, fill=self.layout.BADGE_TEXT_COLOR, font=font, anchor="mm")
+
+    def generate_leaderboard_image(self, rankings: list, background_path: str,
+                                   page_number: int = 1, total_pages: int = 1) -> io.BytesIO | None:
         """
-        Creates the full leaderboard image with all players and returns it as a BytesIO object.
+        Creates one leaderboard image and returns it as a BytesIO object.
+        Only the first `page_size` players of `rankings` fit; use `paginate` for larger rosters.
+        Pages after the first number their slots from (page_number - 1) * page_size + 1.
+        Safe to call from worker threads to render several pages in parallel.
         """
         try:
-            with Image.open(background_path).convert("RGBA") as background:
-                background = background.resize(self.layout.BACKGROUND_SIZE)
-
-                # Create a new image to draw on
-                image = Image.new("RGBA", self.layout.BACKGROUND_SIZE)
-                image.paste(background)
-
-                draw = ImageDraw.Draw(image)
-
-                # Loop through columns and rows to place each player
-                for i, col_x in enumerate(self.layout.COLUMN_X_OFFSETS):
+            # Start from a copy of the cached background
+            position_offset = (page_number - 1) * self.page_size
+            if position_offset:
+                image = self._get_plain_background(background_path).copy()
+            else:
+                image = self._get_background(background_path).copy()
+
+            draw = ImageDraw.Draw(image)
+
+            # Number every slot on pages after the first, including empty ones
+            if position_offset:
+                for i in range(len(self.layout.COLUMN_X_OFFSETS)):
                     for j, row_y in enumerate(self.layout.ROW_Y_OFFSETS):
-                        player_index = i * len(self.layout.ROW_Y_OFFSETS) + j
-                        if player_index >= len(rankings):
-                            break
-
-                        player = rankings[player_index]
-                        self._draw_player(draw, image, player, col_x, row_y)
-
-                # Save the final image to an in-memory buffer
-                final_buffer = io.BytesIO()
-                image.save(final_buffer, format="PNG")
-                final_buffer.seek(0)
-                return final_buffer
+                        position = position_offset + i * len(self.layout.ROW_Y_OFFSETS) + j + 1
+                        self._draw_position_badge(draw, i, row_y, position)
+
+            # Loop through columns and rows to place each player
+            for i, col_x in enumerate(self.layout.COLUMN_X_OFFSETS):
+                for j, row_y in enumerate(self.layout.ROW_Y_OFFSETS):
+                    player_index = i * len(self.layout.ROW_Y_OFFSETS) + j
+                    if player_index >= len(rankings):
+                        break
+
+                    player = rankings[player_index]
+                    self._draw_player(draw, image, player, col_x, row_y)
+
+            if total_pages > 1:
+                draw.text(self.layout.PAGE_LABEL_POS, f"Page {page_number}/{total_pages}",
+                          fill="white", font=self.font_small)
+
+            # Save the final image to an in-memory buffer
+            final_buffer = io.BytesIO()
+            image.save(final_buffer, format="PNG")
+            final_buffer.seek(0)
+            return final_buffer
 
         except FileNotFoundError:
             logging.error(f"Background image not found at: {background_path}")
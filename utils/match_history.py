@@ -0,0 +1,88 @@
+# utils/match_history.py
+
+import json
+import logging
+import os
+
+
+def summarize_match(game_type: str, match: dict, puuid: str) -> dict | None:
+    """Reduces a full match payload to the few fields we keep for one player."""
+    info = match.get("info", {})
+    match_id = match.get("metadata", {}).get("matchId") or match.get("metadata", {}).get("match_id")
+    participant = next((p for p in info.get("participants", []) if p.get("puuid") == puuid), None)
+    if participant is None:
+        return None
+
+    if game_type == "LoL":
+        return {
+            "id": match_id,
+            "time": info.get("gameEndTimestamp", info.get("gameCreation", 0)) // 1000,
+            "queue": info.get("queueId"),
+            "duration": info.get("gameDuration"),
+            "champion": participant.get("championName"),
+            "kda": [participant.get("kills", 0), participant.get("deaths", 0), participant.get("assists", 0)],
+            "win": participant.get("win", False),
+        }
+    return {
+        "id": match_id,
+        "time": int(info.get("game_datetime", 0)) // 1000,
+        "queue": info.get("queue_id"),
+        "placement": participant.get("placement"),
+        "level": participant.get("level"),
+    }
+
+
+class MatchHistoryStore:
+    """
+    Persistent per-player match summaries plus the cursor (last seen match id) used to
+    fetch only newer matches. Stored as JSON, like the rank history and identity cache.
+    """
+
+    def __init__(self, path: str, max_matches_per_player: int):
+        self.path = path
+        self.max_matches_per_player = max_matches_per_player
+        self.cursors: dict[str, dict[str, str]] = {}  # game -> puuid -> last seen match id
+        self.matches: dict[str, dict[str, list]] = {}  # game -> puuid -> [summary, ...], oldest first
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.cursors = data.get("cursors", {})
+            self.matches = data.get("matches", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.error(f"Could not read match history {self.path}, starting empty: {e}")
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"cursors": self.cursors, "matches": self.matches}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            logging.error(f"Could not write match history {self.path}: {e}")
+
+    def get_cursor(self, game_type: str, puuid: str) -> str | None:
+        return self.cursors.get(game_type, {}).get(puuid)
+
+    def add_matches(self, game_type: str, puuid: str, summaries: list, cursor: str | None):
+        """Appends new summaries (oldest first), moves the cursor and trims to the retention limit."""
+        if cursor:
+            self.cursors.setdefault(game_type, {})[puuid] = cursor
+        if summaries:
+            stored = self.matches.setdefault(game_type, {}).setdefault(puuid, [])
+            stored.extend(summaries)
+            del stored[:-self.max_matches_per_player]
+        self.dirty = True
+
+    def get_matches(self, game_type: str, puuid: str, limit: int | None = None) -> list:
+        """The player's most recent match summaries, oldest first."""
+        stored = self.matches.get(game_type, {}).get(puuid, [])
+        return stored[-limit:] if limit else stored[:]
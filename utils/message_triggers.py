@@ -0,0 +1,80 @@
+# utils/message_triggers.py
+
+import io
+import logging
+import os
+import re
+
+import discord
+
+
+class MessageTrigger:
+    """A single configured response. Built once at startup, reused for every message."""
+    __slots__ = ("trigger", "content", "filename", "file_bytes", "delete_message", "channels",
+                 "followup", "followup_user_id")
+
+    def __init__(self, trigger: str, content: str | None = None, file: str | None = None,
+                 delete_message: bool = True, channels: list | None = None,
+                 followup: str | None = None, followup_user_id: int | None = None):
+        self.trigger = trigger
+        self.content = content
+        self.filename = os.path.basename(file) if file else None
+        self.file_bytes = self._load_file(file) if file else None
+        self.delete_message = delete_message
+        self.channels = frozenset(channels) if channels else None
+        self.followup = followup
+        self.followup_user_id = followup_user_id
+
+    @staticmethod
+    def _load_file(path: str) -> bytes | None:
+        """Reads the attachment once so hot triggers never touch the disk again."""
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError as e:
+            logging.warning(f"Could not load attachment {path} for message trigger: {e}")
+            return None
+
+    def allows_channel(self, channel_id: int) -> bool:
+        return self.channels is None or channel_id in self.channels
+
+    def make_file(self) -> discord.File | None:
+        """Builds a fresh discord.File from the cached bytes (a File can only be sent once)."""
+        if self.file_bytes is None:
+            return None
+        return discord.File(io.BytesIO(self.file_bytes), filename=self.filename)
+
+
+class MessageTriggerRegistry:
+    """
+    Dispatches incoming messages to their configured response.
+    Exact triggers are a single dict lookup; pattern triggers are precompiled regexes
+    that are only tried when no exact trigger matched.
+    """
+
+    def __init__(self, trigger_configs: list[dict]):
+        self.exact: dict[str, MessageTrigger] = {}
+        self.patterns: list[tuple[re.Pattern, MessageTrigger]] = []
+
+        for trigger_config in trigger_configs:
+            trigger_config = dict(trigger_config)
+            match_type = trigger_config.pop("match", "exact")
+            trigger = MessageTrigger(**trigger_config)
+            if trigger.filename and trigger.file_bytes is None and not trigger.content:
+                continue  # Nothing left to send; don't delete people's messages for nothing
+            if match_type == "pattern":
+                self.patterns.append((re.compile(trigger.trigger, re.IGNORECASE), trigger))
+            else:
+                self.exact[trigger.trigger.lower()] = trigger
+
+        logging.info(f"Loaded {len(self.exact)} exact and {len(self.patterns)} pattern message triggers.")
+
+    def match(self, content: str, channel_id: int) -> MessageTrigger | None:
+        """Returns the trigger for a message, or None if it doesn't match anything in this channel."""
+        trigger = self.exact.get(content.lower())
+        if trigger and trigger.allows_channel(channel_id):
+            return trigger
+        for pattern, trigger in self.patterns:
+            if trigger.allows_channel(channel_id) and pattern.search(content):
+                return trigger
+        return None
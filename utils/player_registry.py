@@ -0,0 +1,186 @@
+# utils/player_registry.py
+
+import json
+import logging
+import re
+
+# A well-formed Discord user mention, e.g. "<@149681004880199681>"
+MENTION_PATTERN = re.compile(r"^<@!?\d+>$")
+
+
+def load_roster(path: str) -> list[dict]:
+    """
+    Reads the roster file and returns the active player entries.
+    Each entry has "name", "discord", and either a "riot_id" (gameName#tagLine, resolved by the bot)
+    or explicit "tft_puuid"/"lol_puuid". An optional "region" is the player's platform (e.g. "euw1"),
+    defaulting to config.REGION. An optional "api_key" pins the player to one of the comma-separated
+    API keys (0-based); explicit PUUIDs must belong to that key (default: the first one).
+    "active": false keeps a player on file without fetching them.
+    """
+    with open(path, encoding="utf-8") as f:
+        roster = json.load(f)
+    entries = [entry for entry in roster.get("players", []) if entry.get("active", True)]
+    for entry in entries:
+        if not isinstance(entry.get("name"), str) or not entry["name"].strip():
+            raise ValueError(f"Roster entry without a valid name: {entry}")
+    return entries
+
+
+class Player:
+    """A single roster entry. Uses __slots__ since we keep one per player for the bot's lifetime."""
+    __slots__ = ("id", "name", "mention", "tft_puuid", "lol_puuid", "platform", "tft_key", "lol_key")
+
+    def __init__(self, player_id: int, name: str, mention: str | None, tft_puuid: str | None, lol_puuid: str | None,
+                 platform: str | None = None, tft_key: int = 0, lol_key: int = 0):
+        self.id = player_id
+        self.name = name
+        self.mention = mention
+        self.tft_puuid = tft_puuid
+        self.lol_puuid = lol_puuid
+        self.platform = platform  # None means the API client's default region
+        # Index of the API key each PUUID was resolved with; every request about the player uses it
+        self.tft_key = tft_key
+        self.lol_key = lol_key
+
+    def get_puuid(self, game_type: str) -> str | None:
+        """Returns the player's PUUID for "TFT" or "LoL"."""
+        return self.tft_puuid if game_type == "TFT" else self.lol_puuid
+
+    def get_key(self, game_type: str) -> int:
+        """Returns the index of the API key the player's PUUID for "TFT" or "LoL" belongs to."""
+        return self.tft_key if game_type == "TFT" else self.lol_key
+
+    @property
+    def display_mention(self) -> str:
+        """The Discord mention if we have a valid one, otherwise the plain display name."""
+        return self.mention or self.name
+
+    def __repr__(self):
+        return f"Player({self.id}, {self.name!r})"
+
+
+class PlayerRegistry:
+    """
+    Single source of truth for player identity.
+    Validates roster entries once when they are loaded and keeps precomputed
+    indexes for O(1) lookups by name or PUUID.
+    """
+
+    def __init__(self):
+        self.players: list[Player] = []
+        self._by_name: dict[str, Player] = {}
+        self._by_puuid: dict[str, Player] = {}
+        self._next_id = 0
+
+    @staticmethod
+    def _name_key(name: str) -> str:
+        """Normalized lookup key so "Azote" and "azote" refer to the same player."""
+        return name.strip().casefold()
+
+    @staticmethod
+    def _platform(entry: dict) -> str | None:
+        region = entry.get("region")
+        return region.strip().lower() if isinstance(region, str) and region.strip() else None
+
+    @classmethod
+    def from_entries(cls, entries: list) -> "PlayerRegistry":
+        """Builds and validates a registry from roster entries (see `load_roster`)."""
+        registry = cls()
+        for entry in entries:
+            registry.add(entry["name"], entry.get("discord"), entry.get("tft_puuid"), entry.get("lol_puuid"),
+                         cls._platform(entry), entry.get("tft_key", 0), entry.get("lol_key", 0))
+        logging.info(f"Player registry loaded with {len(registry.players)} players.")
+        return registry
+
+    def sync(self, entries: list) -> tuple[list, list]:
+        """
+        Applies a freshly loaded roster incrementally.
+        Unchanged players keep their Player object (and therefore their id and cached rankings).
+        Returns (added, removed) lists of Player objects; a player whose PUUIDs changed
+        appears in both, since they must be dropped and fetched again.
+        """
+        added, removed = [], []
+        wanted = {self._name_key(entry["name"]): entry for entry in entries}
+
+        for player in self.players[:]:
+            entry = wanted.get(self._name_key(player.name))
+            if entry is None or (entry.get("tft_puuid"), entry.get("lol_puuid")) != (player.tft_puuid, player.lol_puuid):
+                removed.append(self.remove(player.name))
+
+        for key, entry in wanted.items():
+            existing = self._by_name.get(key)
+            if existing is None:
+                player = self.add(entry["name"], entry.get("discord"), entry.get("tft_puuid"), entry.get("lol_puuid"),
+                                  self._platform(entry), entry.get("tft_key", 0), entry.get("lol_key", 0))
+                if player:
+                    added.append(player)
+            else:
+                # Cosmetic changes only: update in place without touching cached state.
+                # A region change only moves where the next requests go, the PUUIDs stay valid.
+                existing.name = entry["name"]
+                existing.platform = self._platform(entry)
+                # Same PUUIDs under another key: only happens for explicit PUUIDs whose "api_key" was corrected
+                existing.tft_key = entry.get("tft_key", 0)
+                existing.lol_key = entry.get("lol_key", 0)
+                mention = entry.get("discord")
+                existing.mention = mention if mention and MENTION_PATTERN.match(mention) else None
+
+        return added, removed
+
+    def add(self, name: str, mention: str | None, tft_puuid: str | None, lol_puuid: str | None,
+            platform: str | None = None, tft_key: int = 0, lol_key: int = 0) -> Player | None:
+        """Validates and registers a player. Returns None (and logs why) if the entry is unusable."""
+        key = self._name_key(name)
+        if key in self._by_name:
+            logging.warning(f"Player registry: duplicate entry for '{name}', ignoring.")
+            return None
+        if not tft_puuid and not lol_puuid:
+            logging.warning(f"Player registry: '{name}' has no TFT or LoL PUUID, skipping.")
+            return None
+        for puuid in (tft_puuid, lol_puuid):
+            if puuid and puuid in self._by_puuid:
+                logging.warning(f"Player registry: '{name}' shares a PUUID with "
+                                f"'{self._by_puuid[puuid].name}', skipping.")
+                return None
+        if mention and not MENTION_PATTERN.match(mention):
+            logging.warning(f"Player registry: invalid Discord mention for '{name}' ({mention!r}), "
+                            f"falling back to display name.")
+            mention = None
+        elif not mention:
+            logging.info(f"Player registry: no Discord mention for '{name}', using display name.")
+
+        player = Player(self._next_id, name, mention, tft_puuid, lol_puuid, platform, tft_key, lol_key)
+        self._next_id += 1
+        self.players.append(player)
+        self._by_name[key] = player
+        for puuid in (tft_puuid, lol_puuid):
+            if puuid:
+                self._by_puuid[puuid] = player
+        return player
+
+    def remove(self, name: str) -> Player | None:
+        """Removes a player and all of its index entries. Returns the removed player, if any."""
+        player = self._by_name.pop(self._name_key(name), None)
+        if player is None:
+            return None
+        self.players.remove(player)
+        for puuid in (player.tft_puuid, player.lol_puuid):
+            if puuid:
+                self._by_puuid.pop(puuid, None)
+        return player
+
+    def get_by_name(self, name: str) -> Player | None:
+        return self._by_name.get(self._name_key(name))
+
+    def get_by_puuid(self, puuid: str) -> Player | None:
+        return self._by_puuid.get(puuid)
+
+    def players_for(self, game_type: str) -> list[Player]:
+        """Players that actually have a PUUID for the given game, so no fetch slot is wasted."""
+        return [p for p in self.players if p.get_puuid(game_type)]
+
+    def __len__(self):
+        return len(self.players)
+
+    def __iter__(self):
+        return iter(self.players)
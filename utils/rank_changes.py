@@ -0,0 +1,202 @@
+# utils/rank_changes.py
+
+import json
+import logging
+import time
+
+from .player_registry import Player
+
+# Tiers from lowest to highest; apex tiers have no divisions and LP can go past 100
+TIER_ORDER = ["UNRANKED", "IRON", "BRONZE", "SILVER", "GOLD", "PLATINUM", "EMERALD", "DIAMOND",
+              "MASTER", "GRANDMASTER", "CHALLENGER"]
+APEX_TIERS = {"MASTER", "GRANDMASTER", "CHALLENGER"}
+_TIER_INDEX = {tier: i for i, tier in enumerate(TIER_ORDER)}
+
+
+class RankChangeEvent:
+    """
+    One change between two consecutive ranking states.
+    kind is one of: "new_entry", "removed", "position_up", "position_down",
+    "promoted", "demoted" (division change within a tier), "tier_up", "tier_down".
+    Positions are 1-based; `overtaken` is the player who held `position` before a position_up,
+    if they now have a strictly lower rank value than the mover.
+    """
+    __slots__ = ("kind", "game_type", "player", "position", "old_position", "old_rank", "new_rank",
+                 "overtaken", "timestamp")
+
+    def __init__(self, kind: str, game_type: str, player, position: int | None = None,
+                 old_position: int | None = None, old_rank: str | None = None, new_rank: str | None = None,
+                 overtaken=None, timestamp: float | None = None):
+        self.kind = kind
+        self.game_type = game_type
+        self.player = player
+        self.position = position
+        self.old_position = old_position
+        self.old_rank = old_rank
+        self.new_rank = new_rank
+        self.overtaken = overtaken
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return (f"RankChangeEvent({self.kind}, {self.player.name!r}, {self.old_position}->{self.position}, "
+                f"{self.old_rank!r}->{self.new_rank!r})")
+
+
+def _division_key(ranking: tuple) -> tuple[int, int]:
+    """(tier index, division index) of a ranking tuple (player, rank_value, lp, tier, tier_division_lp)."""
+    tier = ranking[3].upper()
+    division = 0 if tier in APEX_TIERS else ranking[1] // 100
+    return _TIER_INDEX.get(tier, 0), division
+
+
+def _rank_label(ranking: tuple) -> str:
+    """Rank text without the LP, e.g. "GOLD II 45 LP" -> "GOLD II", "UNRANKED" -> "UNRANKED"."""
+    text = ranking[4]
+    return text[:-len(" LP")].rsplit(" ", 1)[0] if text.endswith(" LP") else text
+
+
+def diff_rankings(game_type: str, old: list, new: list, timestamp: float | None = None) -> list[RankChangeEvent]:
+    """
+    Computes the complete, ordered diff between two ranking states in O(n).
+    Events are ordered by new position (removals last), so the biggest changes at the top come first.
+    """
+    old_positions = {ranking[0].id: i for i, ranking in enumerate(old)}
+    new_positions = {ranking[0].id: i for i, ranking in enumerate(new)}
+    events = []
+
+    for i, ranking in enumerate(new):
+        player = ranking[0]
+        j = old_positions.get(player.id)
+        if j is None:
+            events.append(RankChangeEvent("new_entry", game_type, player, position=i + 1,
+                                          new_rank=_rank_label(ranking), timestamp=timestamp))
+            continue
+
+        previous = old[j]
+        if i < j:
+            # The player who held this spot before, if they are now behind the mover with a lower
+            # rank value. Ties never count as an overtake, however they happen to be ordered.
+            holder = old[i][0]
+            holder_position = new_positions.get(holder.id, -1)
+            overtaken = holder if holder_position > i and ranking[1] > new[holder_position][1] else None
+            events.append(RankChangeEvent("position_up", game_type, player, position=i + 1, old_position=j + 1,
+                                          overtaken=overtaken, timestamp=timestamp))
+        elif i > j:
+            events.append(RankChangeEvent("position_down", game_type, player, position=i + 1, old_position=j + 1,
+                                          timestamp=timestamp))
+
+        old_key, new_key = _division_key(previous), _division_key(ranking)
+        if old_key != new_key:
+            if old_key[0] != new_key[0]:
+                kind = "tier_up" if new_key > old_key else "tier_down"
+            else:
+                kind = "promoted" if new_key > old_key else "demoted"
+            events.append(RankChangeEvent(kind, game_type, player, position=i + 1, old_position=j + 1,
+                                          old_rank=_rank_label(previous), new_rank=_rank_label(ranking),
+                                          timestamp=timestamp))
+
+    for j, ranking in enumerate(old):
+        if ranking[0].id not in new_positions:
+            events.append(RankChangeEvent("removed", game_type, ranking[0], old_position=j + 1,
+                                          old_rank=_rank_label(ranking), timestamp=timestamp))
+    return events
+
+
+# =================================================================================
+# SNAPSHOT (DE)SERIALIZATION FOR RECORDING AND OFFLINE REPLAY
+# =================================================================================
+def snapshot_to_json(game_type: str, rankings: list, timestamp: float) -> str:
+    rows = [[r[0].id, r[0].name, r[1], r[2], r[3], r[4]] for r in rankings]
+    return json.dumps({"game": game_type, "time": timestamp, "rankings": rows}, ensure_ascii=False)
+
+
+def load_snapshots(path: str) -> list[tuple[str, float, list]]:
+    """Reads recorded snapshots (JSON lines) back into (game, time, rankings) with lightweight players."""
+    players = {}
+    snapshots = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            rankings = []
+            for player_id, name, rank_value, lp, tier, tier_division_lp in record["rankings"]:
+                player = players.get(player_id)
+                if player is None:
+                    player = players[player_id] = Player(player_id, name, None, None, None)
+                rankings.append((player, rank_value, lp, tier, tier_division_lp))
+            snapshots.append((record["game"], record["time"], rankings))
+    return snapshots
+
+
+# =================================================================================
+# DETECTOR AND SINKS
+# =================================================================================
+class SnapshotRecorder:
+    """Appends every processed state to a JSON lines file, for replay later."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def record(self, game_type: str, rankings: list, timestamp: float):
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(snapshot_to_json(game_type, rankings, timestamp) + "\n")
+        except OSError as e:
+            logging.error(f"Could not record ranking snapshot to {self.path}: {e}")
+
+
+async def logging_sink(events: list[RankChangeEvent]):
+    """A sink that only logs the events."""
+    for event in events:
+        logging.info(f"[{event.game_type}] {event!r}")
+
+
+class RankChangeDetector:
+    """
+    Diffs every new ranking state against the previous one per game and hands
+    the resulting events to pluggable sinks (async callables taking a list of events).
+    """
+
+    def __init__(self, sinks: list | None = None, recorder: SnapshotRecorder | None = None):
+        self.sinks = list(sinks or [])
+        self.recorder = recorder
+        self.states: dict[str, list] = {}
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+
+    async def process(self, game_type: str, rankings: list) -> list[RankChangeEvent]:
+        """
+        Diffs `rankings` against the previous state of the game and dispatches the events.
+        The diff and state update happen before the first await, so concurrent callers
+        are always diffed in the order they were called.
+        """
+        timestamp = time.time()
+        previous = self.states.get(game_type)
+        self.states[game_type] = rankings
+        if self.recorder:
+            self.recorder.record(game_type, rankings, timestamp)
+        if previous is None:
+            return []  # First state: nothing to compare to
+
+        events = diff_rankings(game_type, previous, rankings, timestamp)
+        if events:
+            for sink in self.sinks:
+                try:
+                    await sink(events)
+                except Exception as e:
+                    logging.error(f"Rank change sink {sink!r} failed: {e}", exc_info=True)
+        return events
+
+    @staticmethod
+    def replay(snapshots: list[tuple[str, float, list]]) -> list[RankChangeEvent]:
+        """Runs the diff over a recorded sequence of snapshots offline and returns every event in order."""
+        states = {}
+        events = []
+        for game_type, timestamp, rankings in snapshots:
+            previous = states.get(game_type)
+            if previous is not None:
+                events.extend(diff_rankings(game_type, previous, rankings, timestamp))
+            states[game_type] = rankings
+        return events
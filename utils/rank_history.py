@@ -0,0 +1,75 @@
+# utils/rank_history.py
+
+import bisect
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+
+
+class RankHistory:
+    """
+    Persistent rank-value history per (game type, PUUID), used for LP charts.
+    A point is only stored when a player's value changes, so a player who doesn't
+    play costs nothing. Each (game, PUUID) has a version counter that goes up whenever
+    that player gets a new point, which chart caches use to know when to re-render.
+    """
+
+    def __init__(self, path: str, max_age_days: int):
+        self.path = path
+        self.max_age_seconds = max_age_days * 24 * 3600
+        self.series: dict[str, dict[str, list]] = {}  # game -> puuid -> [[timestamp, rank_value], ...]
+        self.versions = defaultdict(int)  # (game, puuid) -> number of points recorded this session
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.series = json.load(f)
+        except FileNotFoundError:
+            self.series = {}
+        except (OSError, ValueError) as e:
+            logging.error(f"Could not read rank history {self.path}, starting empty: {e}")
+            self.series = {}
+
+    def save(self):
+        """Prunes points older than the retention window and writes the history atomically."""
+        if not self.dirty:
+            return
+        cutoff = time.time() - self.max_age_seconds
+        for players in self.series.values():
+            for puuid, points in players.items():
+                # Keep the last point before the cutoff so the line still starts at the right value
+                first_kept = bisect.bisect_left(points, cutoff, key=lambda p: p[0])
+                if first_kept > 1:
+                    del points[:first_kept - 1]
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.series, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            logging.error(f"Could not write rank history {self.path}: {e}")
+
+    def record(self, game_type: str, puuid: str, rank_value: int, timestamp: float | None = None) -> bool:
+        """Stores a new value if it differs from the last one. Returns True if something was recorded."""
+        points = self.series.setdefault(game_type, {}).setdefault(puuid, [])
+        if points and points[-1][1] == rank_value:
+            return False
+        points.append([timestamp if timestamp is not None else time.time(), rank_value])
+        self.versions[(game_type, puuid)] += 1
+        self.dirty = True
+        return True
+
+    def get_version(self, game_type: str, puuid: str) -> int:
+        return self.versions.get((game_type, puuid), 0)
+
+    def get_points(self, game_type: str, puuid: str, since: float) -> list:
+        """Returns the points from `since` onwards, plus the last point before it (the starting value)."""
+        points = self.series.get(game_type, {}).get(puuid, [])
+        start = bisect.bisect_left(points, since, key=lambda p: p[0])
+        return points[max(0, start - 1):]
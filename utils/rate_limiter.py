@@ -0,0 +1,40 @@
+# utils/rate_limiter.py
+
+import time
+from collections import deque
+
+
+class RateBudget:
+    """
+    Client-side request budget for an API key on one routing host.
+    Riot enforces several sliding windows at once (e.g. 20 requests / 1s and
+    100 requests / 2min for a development key), so each (limit, window) pair
+    keeps the timestamps of its recent requests.
+    """
+
+    def __init__(self, limits: list[tuple[int, float]]):
+        self.windows = [(limit, window, deque()) for limit, window in limits]
+        self.blocked_until = 0.0
+        self.requests_made = 0
+
+    def wait_time(self) -> float:
+        """Seconds until a request fits in every window (0 if one can be sent now)."""
+        now = time.monotonic()
+        wait = self.blocked_until - now
+        for limit, window, sent in self.windows:
+            while sent and sent[0] <= now - window:
+                sent.popleft()
+            if len(sent) >= limit:
+                wait = max(wait, sent[0] + window - now)
+        return max(0.0, wait)
+
+    def consume(self):
+        """Counts a request against every window. Call only when `wait_time()` is 0."""
+        now = time.monotonic()
+        for _, _, sent in self.windows:
+            sent.append(now)
+        self.requests_made += 1
+
+    def block_for(self, seconds: float):
+        """Stops using this budget for a while, e.g. after a 429 with Retry-After."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
@@ -0,0 +1,88 @@
+# utils/single_flight.py
+
+import asyncio
+import logging
+from collections import defaultdict
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one in-flight request.
+    The first caller for a key starts the request; everyone arriving while it
+    is still running awaits the same task instead of making their own call.
+    """
+
+    def __init__(self, per_key_kinds: tuple = ()):
+        self._in_flight: dict[object, asyncio.Task] = {}
+        # Kinds of keys (first element of tuple keys, e.g. "ranked") whose counters are kept per key.
+        # Use it for bounded key spaces only; other kinds (e.g. match ids) are counted per kind.
+        self.per_key_kinds = set(per_key_kinds)
+        # How many times the call really ran vs. was shared, per key or per kind (see above)
+        self.calls_made = defaultdict(int)
+        self.calls_saved = defaultdict(int)
+
+    @staticmethod
+    def _kind(key) -> object:
+        """The kind of a key: its first element for tuple keys, the key itself otherwise."""
+        return key[0] if isinstance(key, tuple) and key else key
+
+    def _counter_key(self, key) -> object:
+        kind = self._kind(key)
+        return key if kind in self.per_key_kinds else kind
+
+    async def do(self, key, coro_func, *args, **kwargs):
+        """Runs `coro_func(*args, **kwargs)` once per key, sharing the result with concurrent callers."""
+        task = self._in_flight.get(key)
+        if task is not None and not task.done():
+            self.calls_saved[self._counter_key(key)] += 1
+        else:
+            # The request runs as its own task so a caller timing out or being
+            # cancelled doesn't cancel it for everyone else waiting on it.
+            task = asyncio.create_task(coro_func(*args, **kwargs))
+            self._in_flight[key] = task
+            self.calls_made[self._counter_key(key)] += 1
+            task.add_done_callback(lambda t, k=key: self._forget(k, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task: asyncio.Task):
+        """Removes a finished task, unless a newer request for the key has already replaced it."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def get_stats(self) -> dict:
+        """
+        Returns the made/saved counters per key (for per-key kinds), totals per kind,
+        and overall totals, e.g. for logging.
+        """
+        counter_keys = set(self.calls_made) | set(self.calls_saved)
+        per_key = {}
+        per_kind = defaultdict(lambda: {"made": 0, "saved": 0})
+        for counter_key in counter_keys:
+            made, saved = self.calls_made[counter_key], self.calls_saved[counter_key]
+            if counter_key in self.per_key_kinds or self._kind(counter_key) not in self.per_key_kinds:
+                kind = counter_key  # Already aggregated per kind
+            else:
+                kind = self._kind(counter_key)
+                per_key[counter_key] = {"made": made, "saved": saved}
+            per_kind[kind]["made"] += made
+            per_kind[kind]["saved"] += saved
+        return {
+            "total_made": sum(self.calls_made.values()),
+            "total_saved": sum(self.calls_saved.values()),
+            "per_kind": dict(per_kind),
+            "per_key": per_key,
+        }
+
+    def log_stats(self, label: str):
+        """Logs a summary of how many calls coalescing has saved so far, and for which keys the most."""
+        stats = self.get_stats()
+        per_kind = ", ".join(
+            f"{kind}: {c['made']}/{c['saved']}" for kind, c in sorted(stats["per_kind"].items(), key=str)
+        )
+        top_saved = sorted(stats["per_key"].items(), key=lambda item: item[1]["saved"], reverse=True)[:5]
+        top_saved = ", ".join(f"{key}: {c['saved']}" for key, c in top_saved if c["saved"])
+        logging.info(
+            f"[{label}] Single-flight: {stats['total_made']} calls made, {stats['total_saved']} saved "
+            f"(made/saved per kind: {per_kind})."
+            + (f" Most saved: {top_saved}." if top_saved else "")
+        )